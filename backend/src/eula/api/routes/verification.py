@@ -24,6 +24,7 @@ from eula.api.schemas import (
 from eula.config import get_settings
 from eula.domain.hashing import compute_bundle_hash
 from eula.domain.models import DocumentType, VerificationStatus
+from eula.infrastructure.duplicate_index import get_duplicate_index
 from eula.services.did import DIDVerifier
 from eula.services.forensic import DocumentInput, ForensicService
 from eula.services.ocr import OCREngine
@@ -45,7 +46,10 @@ def get_forensic_service() -> ForensicService:
         settings = get_settings()
         _forensic_service = ForensicService(
             ocr=OCREngine(),
-            xrpl=XRPLService(network=XRPLNetwork(settings.xrpl_network)),
+            xrpl=XRPLService(
+                network=XRPLNetwork(settings.xrpl_network),
+                duplicate_index=get_duplicate_index(),
+            ),
             did=DIDVerifier(network=settings.xrpl_network),
             confidence_threshold=settings.ocr_confidence_threshold,
         )
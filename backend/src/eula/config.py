@@ -46,6 +46,10 @@ class Settings(BaseSettings):
         default=Path("./storage"),
         description="Local path for document storage"
     )
+    duplicate_index_path: Path = Field(
+        default=Path("./storage/nft_hashes.db"),
+        description="SQLite file indexing minted invoice hashes for duplicate checks"
+    )
     
     # OCR Configuration
     ocr_confidence_threshold: float = Field(
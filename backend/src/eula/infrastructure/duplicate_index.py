@@ -0,0 +1,208 @@
+"""
+Off-chain index of minted invoice hashes.
+
+Lets duplicate checks answer "was this invoice already tokenized?"
+without scanning the XRP Ledger. Hashes are kept in a SQLite file that
+every worker process opens; a Bloom filter in front of it keeps the
+common "never seen" answer off the hash table.
+"""
+
+import hashlib
+import logging
+import math
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from eula.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class _BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+    
+    Answers "definitely not added" or "maybe added"; sized so that the
+    false positive rate stays near the target up to the expected count.
+    """
+    
+    def __init__(self, expected_items: int, false_positive_rate: float) -> None:
+        expected_items = max(expected_items, 1)
+        num_bits = math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2)
+        self._num_bits = max(num_bits, 8)
+        self._num_hashes = max(round(self._num_bits / expected_items * math.log(2)), 1)
+        self._bits = bytearray((self._num_bits + 7) // 8)
+    
+    def _positions(self, item: str) -> list[int]:
+        """Bit positions for an item (double hashing over one digest)."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._num_bits for i in range(self._num_hashes)]
+    
+    def add(self, item: str) -> None:
+        """Add an item."""
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, item: str) -> bool:
+        """False if the item was never added; True if it probably was."""
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class DuplicateIndex:
+    """
+    Off-chain index of minted invoice hashes.
+    
+    Answers "was this invoice already tokenized?" without scanning the
+    ledger. Hashes live in SQLite; an in-memory Bloom filter in front of
+    it answers the common "never seen" case with at most a lookup of rows
+    newer than the filter, so workers sharing the database see each
+    other's hashes.
+    The filter is saved alongside the hashes on close, so reopening a large
+    index does not re-read every hash.
+    
+    Example:
+        with DuplicateIndex("storage/nft_hashes.db") as index:
+            service = XRPLService(duplicate_index=index)
+    """
+    
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        expected_items: int = 100_000,
+        false_positive_rate: float = 0.01,
+    ) -> None:
+        """
+        Open (or create) the index.
+        
+        Args:
+            path: SQLite database file (":memory:" for a throwaway index)
+            expected_items: Hash count the Bloom filter is sized for
+            false_positive_rate: Target Bloom filter false positive rate
+        """
+        # FastAPI runs sync handlers on a thread pool, so the connection
+        # is shared across threads behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS nft_hashes ("
+            "invoice_hash TEXT PRIMARY KEY, nft_id TEXT, issuer TEXT)"
+        )
+        # Bloom filter bits saved on close, with the last row they cover
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS bloom_filter ("
+            "id INTEGER PRIMARY KEY CHECK (id = 0), "
+            "num_bits INTEGER, num_hashes INTEGER, last_rowid INTEGER, bits BLOB)"
+        )
+        self._conn.commit()
+        
+        count = self._conn.execute("SELECT COUNT(*) FROM nft_hashes").fetchone()[0]
+        self._bloom = _BloomFilter(max(expected_items, 2 * count), false_positive_rate)
+        
+        # Reuse the saved filter when it has the same shape and only add the
+        # hashes recorded after it was saved (e.g. before a crash); otherwise
+        # rebuild it from the table
+        self._last_rowid = 0  # Highest row whose hash is in the filter
+        saved = self._conn.execute(
+            "SELECT num_bits, num_hashes, last_rowid, bits FROM bloom_filter"
+        ).fetchone()
+        if saved is not None and saved[:2] == (self._bloom._num_bits, self._bloom._num_hashes):
+            self._bloom._bits[:] = saved[3]
+            self._last_rowid = saved[2]
+        self._catch_up()
+    
+    def _catch_up(self) -> None:
+        """
+        Add rows recorded since the filter was last brought up to date.
+        
+        Other connections to the same database (other workers) insert rows
+        too, so the filter only ever claims the rows it has actually read.
+        """
+        for rowid, invoice_hash in self._conn.execute(
+            "SELECT rowid, invoice_hash FROM nft_hashes WHERE rowid > ? ORDER BY rowid",
+            (self._last_rowid,),
+        ):
+            self._bloom.add(invoice_hash)
+            self._last_rowid = rowid
+    
+    def add(self, invoice_hash: str, nft_id: str | None, issuer: str | None) -> None:
+        """Record a minted invoice hash (the first NFT for a hash is kept)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO nft_hashes (invoice_hash, nft_id, issuer) "
+                "VALUES (?, ?, ?)",
+                (invoice_hash, nft_id, issuer),
+            )
+            self._conn.commit()
+            self._bloom.add(invoice_hash)
+            self._catch_up()
+    
+    def lookup(self, invoice_hash: str) -> tuple[str | None, str | None] | None:
+        """Return (nft_id, issuer) for a recorded hash, or None."""
+        with self._lock:
+            if invoice_hash not in self._bloom:
+                # Another worker may have recorded it since the filter was
+                # last updated; reading only the newer rows keeps this cheap
+                self._catch_up()
+                if invoice_hash not in self._bloom:
+                    return None
+            return self._conn.execute(
+                "SELECT nft_id, issuer FROM nft_hashes WHERE invoice_hash = ?",
+                (invoice_hash,),
+            ).fetchone()
+    
+    def __enter__(self) -> "DuplicateIndex":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def save(self) -> None:
+        """Save the Bloom filter so the next open can skip rebuilding it."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO bloom_filter "
+                "(id, num_bits, num_hashes, last_rowid, bits) VALUES (0, ?, ?, ?, ?)",
+                (
+                    self._bloom._num_bits,
+                    self._bloom._num_hashes,
+                    self._last_rowid,
+                    bytes(self._bloom._bits),
+                ),
+            )
+            self._conn.commit()
+    
+    def close(self) -> None:
+        """Save the Bloom filter and close the database connection."""
+        self.save()
+        with self._lock:
+            self._conn.close()
+
+
+# Duplicate index shared by every service in the process
+_duplicate_index: DuplicateIndex | None = None
+
+
+def get_duplicate_index() -> DuplicateIndex:
+    """Get or open the index of minted invoice hashes configured in settings."""
+    global _duplicate_index
+    if _duplicate_index is None:
+        settings = get_settings()
+        settings.duplicate_index_path.parent.mkdir(parents=True, exist_ok=True)
+        _duplicate_index = DuplicateIndex(settings.duplicate_index_path)
+        logger.info(f"Duplicate index opened at {settings.duplicate_index_path}")
+    return _duplicate_index
+
+
+def close_duplicate_index() -> None:
+    """Save and close the duplicate index on shutdown."""
+    global _duplicate_index
+    if _duplicate_index is not None:
+        _duplicate_index.close()
+        _duplicate_index = None
+        logger.info("Duplicate index closed")
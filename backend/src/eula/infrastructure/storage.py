@@ -255,3 +255,4 @@ class DocumentStorageService:
             if await self.backend.delete(path):
                 deleted += 1
         return deleted
+
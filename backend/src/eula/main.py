@@ -19,6 +19,7 @@ from eula import __version__
 from eula.api.routes import debug, health, mint, verification
 from eula.config import get_settings
 from eula.infrastructure.database import close_db, init_db
+from eula.infrastructure.duplicate_index import close_duplicate_index
 
 # Configure logging
 logging.basicConfig(
@@ -61,6 +62,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down EULA")
     await close_db()
+    close_duplicate_index()
 
 
 def create_app() -> FastAPI:
@@ -9,24 +9,50 @@ Design Decisions:
 - Page-by-page processing for memory efficiency
 - Confidence scores preserved for downstream review flagging
 - Bounding boxes normalized to 0-1 range for consistency
+- Slotted dataclasses keep per-block memory low on large documents
 
 Note: docTR requires PyTorch or TensorFlow backend. We use PyTorch.
 """
 
+import hashlib
 import io
 import json
 import logging
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 from typing import BinaryIO
 
 from PIL import Image
 
+try:
+    import orjson  # Optional: faster serialization of large debug dumps
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Blocks below this confidence are flagged for manual review
+LOW_CONFIDENCE_THRESHOLD = 0.7
+
+# PDF render scale (matches docTR's DocumentFile.from_pdf default)
+PDF_RENDER_SCALE = 2
+
+# Number of recognised pages kept for reuse across documents
+PAGE_CACHE_SIZE = 512
+
+# Printable characters every page's embedded text needs before a PDF is
+# treated as born-digital and read without OCR
+TEXT_LAYER_MIN_CHARS = 20
+
+# docTR architectures: (detection, recognition)
+ACCURATE_ARCHS = ("db_resnet50", "crnn_vgg16_bn")
+FAST_ARCHS = ("db_mobilenet_v3_large", "crnn_mobilenet_v3_small")
+
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """
     A block of text extracted from a document with spatial information.
@@ -76,7 +102,7 @@ class TextBlock:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRPage:
     """OCR results for a single page."""
     page_number: int
@@ -94,39 +120,83 @@ class OCRPage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRResult:
     """Complete OCR results for a document."""
     pages: list[OCRPage]
     processing_time_ms: float = 0
+    _stats_cache: tuple[int, float, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _text_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+    _text_lower_cache: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def iter_blocks(self) -> Iterator[TextBlock]:
+        """Iterate over all text blocks across all pages without copying."""
+        for page in self.pages:
+            yield from page.blocks
     
     @property
     def all_blocks(self) -> list[TextBlock]:
-        """Flatten all text blocks across all pages."""
+        """Flatten all text blocks across all pages (for indexed access)."""
         return [block for page in self.pages for block in page.blocks]
     
     @property
     def full_text(self) -> str:
-        """Concatenate all text in reading order."""
-        return "\n".join(block.text for block in self.all_blocks)
+        """Concatenate all text in reading order (built once, then cached)."""
+        if self._text_cache is None:
+            self._text_cache = "\n".join(block.text for block in self.iter_blocks())
+        return self._text_cache
+    
+    @property
+    def full_text_lower(self) -> str:
+        """Lowercased full text, for case-insensitive label searches."""
+        if self._text_lower_cache is None:
+            self._text_lower_cache = self.full_text.lower()
+        return self._text_lower_cache
     
     @property
     def total_blocks(self) -> int:
         """Total number of text blocks across all pages."""
-        return sum(len(page.blocks) for page in self.pages)
+        return self._stats()[0]
     
     @property
     def avg_confidence(self) -> float:
         """Average confidence across all blocks."""
-        blocks = self.all_blocks
-        if not blocks:
-            return 0.0
-        return sum(b.confidence for b in blocks) / len(blocks)
+        return self._stats()[1]
     
     @property
     def low_confidence_blocks(self) -> list[TextBlock]:
         """Blocks with confidence below 0.7."""
-        return [b for b in self.all_blocks if b.confidence < 0.7]
+        return [b for b in self.iter_blocks() if b.confidence < LOW_CONFIDENCE_THRESHOLD]
+    
+    @property
+    def low_confidence_count(self) -> int:
+        """Number of blocks with confidence below 0.7, without listing them."""
+        return self._stats()[2]
+    
+    def _stats(self) -> tuple[int, float, int]:
+        """
+        Compute (total blocks, average confidence, low-confidence count).
+        
+        All three are gathered in a single walk over the blocks and cached,
+        since results are not modified once the engine has built them.
+        """
+        if self._stats_cache is None:
+            total = 0
+            confidence_sum = 0.0
+            low_count = 0
+            for page in self.pages:
+                for block in page.blocks:
+                    total += 1
+                    confidence_sum += block.confidence
+                    if block.confidence < LOW_CONFIDENCE_THRESHOLD:
+                        low_count += 1
+            avg = confidence_sum / total if total else 0.0
+            self._stats_cache = (total, avg, low_count)
+        return self._stats_cache
     
     def to_dict(self) -> dict:
         """Convert to dictionary for logging/debugging."""
@@ -135,7 +205,7 @@ class OCRResult:
             "total_blocks": self.total_blocks,
             "avg_confidence": round(self.avg_confidence, 3),
             "processing_time_ms": round(self.processing_time_ms, 1),
-            "low_confidence_count": len(self.low_confidence_blocks),
+            "low_confidence_count": self.low_confidence_count,
             "pages": [p.to_dict() for p in self.pages],
         }
     
@@ -143,6 +213,46 @@ class OCRResult:
         """Export full results as pretty JSON for debugging."""
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
     
+    def to_json(self) -> str:
+        """
+        Serialize the full result for caching (see from_json).
+        
+        Unlike to_dict, values are not rounded, so a reloaded result
+        extracts exactly the same fields as the original.
+        """
+        return json.dumps({
+            "processing_time_ms": self.processing_time_ms,
+            "pages": [
+                {
+                    "page_number": page.page_number,
+                    "width": page.width,
+                    "height": page.height,
+                    "blocks": [
+                        [b.text, b.confidence, b.x_min, b.y_min, b.x_max, b.y_max, b.page]
+                        for b in page.blocks
+                    ],
+                }
+                for page in self.pages
+            ],
+        }, ensure_ascii=False)
+    
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "OCRResult":
+        """Rebuild a result serialized with to_json."""
+        raw = json.loads(data)
+        return cls(
+            pages=[
+                OCRPage(
+                    page_number=page["page_number"],
+                    width=page["width"],
+                    height=page["height"],
+                    blocks=[TextBlock(*block) for block in page["blocks"]],
+                )
+                for page in raw["pages"]
+            ],
+            processing_time_ms=raw["processing_time_ms"],
+        )
+    
     def print_summary(self) -> None:
         """Print a human-readable summary to console."""
         print("\n" + "=" * 60)
@@ -152,19 +262,19 @@ class OCRResult:
         print(f"Total blocks: {self.total_blocks}")
         print(f"Average confidence: {self.avg_confidence:.1%}")
         print(f"Processing time: {self.processing_time_ms:.0f}ms")
-        print(f"Low confidence blocks: {len(self.low_confidence_blocks)}")
+        print(f"Low confidence blocks: {self.low_confidence_count}")
         print("-" * 60)
         
         for page in self.pages:
             print(f"\nPage {page.page_number + 1} ({page.width}x{page.height}):")
             print("-" * 40)
             for block in page.blocks[:20]:  # First 20 blocks
-                conf_indicator = "✓" if block.confidence >= 0.7 else "⚠"
+                conf_indicator = "✓" if block.confidence >= LOW_CONFIDENCE_THRESHOLD else "⚠"
                 print(f"  {conf_indicator} [{block.confidence:.0%}] {block.text[:50]}")
             if len(page.blocks) > 20:
                 print(f"  ... and {len(page.blocks) - 20} more blocks")
         
-        if self.low_confidence_blocks:
+        if self.low_confidence_count:
             print("\n" + "-" * 60)
             print("LOW CONFIDENCE BLOCKS (may need review):")
             for block in self.low_confidence_blocks[:10]:
@@ -177,14 +287,73 @@ class OCRResult:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w") as f:
-            f.write(f"# OCR Debug Output\n")
-            f.write(f"# Generated: {datetime.now().isoformat()}\n\n")
-            f.write(self.to_debug_json())
+        header = f"# OCR Debug Output\n# Generated: {datetime.now().isoformat()}\n\n"
+        if orjson is not None:
+            body = orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        else:
+            body = self.to_debug_json().encode("utf-8")
+        output_path.write_bytes(header.encode("utf-8") + body)
         
         logger.info(f"OCR debug output saved to: {output_path}")
 
 
+def _text_layer_page(pdf_page, page_idx: int) -> OCRPage:
+    """
+    Build an OCRPage from a PDF page's embedded text, one block per word.
+    
+    Boxes are normalized like docTR's (top-left origin) and page dimensions
+    are those of the page rendered at PDF_RENDER_SCALE.
+    """
+    page_width, page_height = pdf_page.get_size()
+    textpage = pdf_page.get_textpage()
+    try:
+        text = textpage.get_text_range()
+        blocks: list[TextBlock] = []
+        word: list[str] = []
+        left = bottom = right = top = 0.0
+        
+        # A trailing space flushes the last word
+        for index, char in enumerate(text + " "):
+            if not char.isspace():
+                c_left, c_bottom, c_right, c_top = textpage.get_charbox(index)
+                if word:
+                    left, bottom = min(left, c_left), min(bottom, c_bottom)
+                    right, top = max(right, c_right), max(top, c_top)
+                else:
+                    left, bottom, right, top = c_left, c_bottom, c_right, c_top
+                word.append(char)
+            elif word:
+                blocks.append(TextBlock(
+                    text="".join(word),
+                    confidence=1.0,
+                    x_min=left / page_width,
+                    y_min=1 - top / page_height,
+                    x_max=right / page_width,
+                    y_max=1 - bottom / page_height,
+                    page=page_idx,
+                ))
+                word = []
+    finally:
+        textpage.close()
+    
+    return OCRPage(
+        page_number=page_idx,
+        width=round(page_width * PDF_RENDER_SCALE),
+        height=round(page_height * PDF_RENDER_SCALE),
+        blocks=blocks,
+    )
+
+
+def _copy_page(page: OCRPage, page_idx: int) -> OCRPage:
+    """Copy a page (and its blocks) under a new page number."""
+    return OCRPage(
+        page_number=page_idx,
+        width=page.width,
+        height=page.height,
+        blocks=[replace(block, page=page_idx) for block in page.blocks],
+    )
+
+
 class OCREngine:
     """
     Document OCR engine using docTR for layout-aware text extraction.
@@ -204,15 +373,38 @@ class OCREngine:
         result.save_debug_output("debug/ocr_output.json")
     """
     
-    def __init__(self, debug: bool = False) -> None:
+    def __init__(
+        self,
+        debug: bool = False,
+        fast: bool = False,
+        compile_models: bool = False,
+        page_cache_size: int = PAGE_CACHE_SIZE,
+        use_text_layer: bool = False,
+    ) -> None:
         """
         Initialize OCR engine.
         
         Args:
             debug: If True, print detailed OCR results to console
+            fast: If True, use the MobileNetV3 detection/recognition models.
+                These run roughly 3-5x faster on CPU at the cost of a few
+                points of accuracy - suitable for interactive previews, not
+                for extractions that get persisted or minted.
+            compile_models: If True, compile the detection and recognition
+                networks with torch.compile (PyTorch 2.0+). Compilation runs
+                on first inference, so call warmup() before serving requests.
+            page_cache_size: Max rendered pages whose OCR output is kept
+                for reuse (0 disables the cache)
+            use_text_layer: If True, read born-digital PDFs from their
+                embedded text instead of running OCR (see read_text_layer)
         """
         self._model = None
         self.debug = debug
+        self.fast = fast
+        self.compile_models = compile_models
+        self.page_cache_size = page_cache_size
+        self.use_text_layer = use_text_layer
+        self._page_cache: OrderedDict[str, OCRPage] = OrderedDict()
     
     def _get_model(self):
         """
@@ -226,12 +418,16 @@ class OCREngine:
                 from doctr.io import DocumentFile
                 from doctr.models import ocr_predictor
                 
-                logger.info("Loading docTR OCR model...")
+                det_arch, reco_arch = FAST_ARCHS if self.fast else ACCURATE_ARCHS
+                
+                logger.info(f"Loading docTR OCR model ({det_arch} + {reco_arch})...")
                 self._model = ocr_predictor(
-                    det_arch="db_resnet50",
-                    reco_arch="crnn_vgg16_bn",
+                    det_arch=det_arch,
+                    reco_arch=reco_arch,
                     pretrained=True,
                 )
+                if self.compile_models:
+                    self._compile_model(self._model)
                 logger.info("docTR model loaded successfully")
             except ImportError as e:
                 logger.error(f"docTR not installed: {e}")
@@ -241,6 +437,46 @@ class OCREngine:
         
         return self._model
     
+    def _compile_model(self, model) -> None:
+        """
+        Compile the docTR networks with torch.compile for kernel fusion.
+        
+        Falls back to eager mode if the installed PyTorch predates 2.0.
+        """
+        import torch
+        
+        if not hasattr(torch, "compile"):
+            logger.warning("torch.compile not available (PyTorch < 2.0), using eager mode")
+            return
+        
+        logger.info("Compiling docTR models with torch.compile...")
+        model.det_predictor.model = torch.compile(
+            model.det_predictor.model,
+            mode="reduce-overhead",
+            fullgraph=False,
+        )
+        model.reco_predictor.model = torch.compile(
+            model.reco_predictor.model,
+            mode="reduce-overhead",
+        )
+    
+    def warmup(self) -> None:
+        """
+        Load the model and run a dummy inference.
+        
+        Call once at startup so the first real document does not pay
+        model loading (and, with compile_models, compilation) cost.
+        """
+        import numpy as np
+        
+        model = self._get_model()
+        
+        logger.info("Warming up docTR model...")
+        model([np.full((1024, 1024, 3), 255, dtype=np.uint8)])
+        # A blank page yields no text crops, so exercise recognition directly
+        model.reco_predictor([np.full((32, 128, 3), 255, dtype=np.uint8)])
+        logger.info("docTR model warm")
+    
     def process_document(
         self,
         content: bytes,
@@ -261,28 +497,38 @@ class OCREngine:
             RuntimeError: If OCR processing fails
         """
         import time
-        from doctr.io import DocumentFile
         
         start_time = time.time()
         
         file_type = file_type.lower().lstrip(".")
         logger.info(f"Processing document: type={file_type}, size={len(content)} bytes")
         
+        if file_type == "pdf" and self.use_text_layer:
+            ocr_result = self.read_text_layer(content)
+            if ocr_result is not None:
+                ocr_result.processing_time_ms = (time.time() - start_time) * 1000
+                logger.info(
+                    f"Embedded text read, OCR skipped: {ocr_result.total_blocks} blocks, "
+                    f"time: {ocr_result.processing_time_ms:.0f}ms"
+                )
+                if self.debug:
+                    ocr_result.print_summary()
+                return ocr_result
+        
+        from doctr.io import DocumentFile
+        
         if file_type == "pdf":
-            doc = DocumentFile.from_pdf(content)
-            logger.debug(f"PDF loaded: {len(doc)} pages")
+            doc = self._load_pdf(content)
+            logger.debug("PDF loaded: %d pages", len(doc))
         elif file_type in ("png", "jpg", "jpeg"):
             doc = DocumentFile.from_images(content)
-            logger.debug(f"Image loaded")
+            logger.debug("Image loaded")
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
         
         model = self._get_model()
         
-        logger.info("Running OCR inference...")
-        result = model(doc)
-        
-        ocr_result = self._convert_result(result, doc)
+        ocr_result = self._run_ocr(model, doc)
         ocr_result.processing_time_ms = (time.time() - start_time) * 1000
         
         # Log summary
@@ -306,13 +552,71 @@ class OCREngine:
         
         return ocr_result
     
-    def process_file(self, file_path: Path, save_debug: bool = False) -> OCRResult:
+    def read_text_layer(
+        self,
+        content: bytes,
+        min_chars: int = TEXT_LAYER_MIN_CHARS,
+    ) -> OCRResult | None:
+        """
+        Read a born-digital PDF from its embedded text, without OCR.
+        
+        Every word becomes a TextBlock with confidence 1.0. Returns None
+        when any page has fewer than min_chars printable characters of
+        embedded text (a scan, or a scanned page mixed in), so the caller
+        can fall back to OCR.
+        """
+        import pypdfium2 as pdfium
+        
+        pdf = pdfium.PdfDocument(content)
+        try:
+            pages = []
+            for page_idx in range(len(pdf)):
+                page = _text_layer_page(pdf[page_idx], page_idx)
+                printable = sum(
+                    char.isprintable() for block in page.blocks for char in block.text
+                )
+                if printable < min_chars:
+                    logger.debug("Page %d has no usable text layer", page_idx)
+                    return None
+                pages.append(page)
+        finally:
+            pdf.close()
+        
+        return OCRResult(pages=pages)
+    
+    def _load_pdf(self, content: bytes) -> list:
+        """
+        Render all PDF pages to numpy arrays for docTR.
+        
+        Pages render in this process, one after another: pdfium is not
+        thread-safe, and forking workers from a server that has already run
+        torch inference risks deadlocks.
+        """
+        import pypdfium2 as pdfium
+        
+        pdf = pdfium.PdfDocument(content)
+        try:
+            return [
+                pdf[i].render(scale=PDF_RENDER_SCALE, rev_byteorder=True).to_numpy()
+                for i in range(len(pdf))
+            ]
+        finally:
+            pdf.close()
+    
+    def process_file(
+        self,
+        file_path: Path,
+        save_debug: bool = False,
+        content: bytes | None = None,
+    ) -> OCRResult:
         """
         Process a document file from disk.
         
         Args:
             file_path: Path to the document file
             save_debug: If True, save debug output next to the file
+            content: The file's bytes, if the caller has already read them
+                (the file is then not read again)
             
         Returns:
             OCRResult with all pages and text blocks
@@ -322,8 +626,10 @@ class OCREngine:
         
         logger.info(f"Processing file: {file_path}")
         
-        with open(file_path, "rb") as f:
-            result = self.process_document(f.read(), suffix)
+        if content is None:
+            with open(file_path, "rb") as f:
+                content = f.read()
+        result = self.process_document(content, suffix)
         
         if save_debug or self.debug:
             debug_path = file_path.with_suffix(".ocr_debug.json")
@@ -331,55 +637,109 @@ class OCREngine:
         
         return result
     
-    def _convert_result(self, doctr_result, doc) -> OCRResult:
+    def _run_ocr(self, model, doc: list) -> OCRResult:
         """
-        Convert docTR result to our OCRResult format.
+        Run OCR on rendered pages, reusing results for pages seen before.
         
-        Normalizes bounding box coordinates to 0-1 range.
+        Pages are keyed by an exact hash of their pixels, so repeated
+        pages (cover sheets, boilerplate terms) only go through the model
+        once. Only the cache misses are sent to docTR, and results are
+        spliced back in original page order.
         """
-        pages: list[OCRPage] = []
-        
-        for page_idx, page in enumerate(doctr_result.pages):
-            # Get page dimensions for normalization
-            page_height, page_width = page.dimensions
-            
-            blocks: list[TextBlock] = []
-            
-            for block in page.blocks:
-                for line in block.lines:
-                    for word in line.words:
-                        # docTR returns coordinates as (x_min, y_min, x_max, y_max)
-                        # Already normalized to 0-1 range
-                        geometry = word.geometry
-                        
-                        text_block = TextBlock(
-                            text=word.value,
-                            confidence=word.confidence,
-                            x_min=geometry[0][0],
-                            y_min=geometry[0][1],
-                            x_max=geometry[1][0],
-                            y_max=geometry[1][1],
-                            page=page_idx,
-                        )
-                        blocks.append(text_block)
-                        
-                        # Log each block at DEBUG level
-                        logger.debug(
-                            f"Block: '{word.value}' conf={word.confidence:.2f} "
-                            f"pos=({geometry[0][0]:.3f}, {geometry[0][1]:.3f})"
-                        )
-            
-            pages.append(OCRPage(
-                page_number=page_idx,
-                width=page_width,
-                height=page_height,
-                blocks=blocks,
-            ))
+        keys = [self._page_key(image) for image in doc]
+        pages: list[OCRPage | None] = [
+            self._cached_page(key, page_idx) for page_idx, key in enumerate(keys)
+        ]
+        
+        # Identical pages within one document only need one inference
+        misses: dict[str, list[int]] = {}
+        for page_idx, page in enumerate(pages):
+            if page is None:
+                misses.setdefault(keys[page_idx], []).append(page_idx)
+        
+        if misses:
+            logger.info(f"Running OCR inference on {len(misses)}/{len(doc)} pages...")
+            result = model([doc[indices[0]] for indices in misses.values()])
             
-            logger.debug(f"Page {page_idx}: {len(blocks)} blocks extracted")
+            for (key, indices), doctr_page in zip(misses.items(), result.pages):
+                page = self._convert_page(doctr_page, indices[0])
+                self._store_page(key, page)
+                for page_idx in indices:
+                    pages[page_idx] = _copy_page(page, page_idx)
+        else:
+            logger.info("All pages served from OCR page cache")
         
         return OCRResult(pages=pages)
     
+    def _page_key(self, image) -> str:
+        """Exact content hash of a rendered page image."""
+        import numpy as np
+        
+        image = np.ascontiguousarray(image)
+        digest = hashlib.blake2b(image.data, digest_size=16).hexdigest()
+        return f"{image.shape}:{digest}"
+    
+    def _cached_page(self, key: str, page_idx: int) -> OCRPage | None:
+        """Look up a previously recognised page, renumbered for this document."""
+        page = self._page_cache.get(key)
+        if page is None:
+            return None
+        self._page_cache.move_to_end(key)
+        return _copy_page(page, page_idx)
+    
+    def _store_page(self, key: str, page: OCRPage) -> None:
+        """Remember a recognised page, evicting the least recently used."""
+        if self.page_cache_size <= 0:
+            return
+        self._page_cache[key] = page
+        self._page_cache.move_to_end(key)
+        while len(self._page_cache) > self.page_cache_size:
+            self._page_cache.popitem(last=False)
+    
+    def _convert_page(self, page, page_idx: int) -> OCRPage:
+        """
+        Convert a docTR page to our OCRPage format.
+        
+        Normalizes bounding box coordinates to 0-1 range.
+        """
+        # Get page dimensions for normalization
+        page_height, page_width = page.dimensions
+        
+        blocks: list[TextBlock] = []
+        
+        for block in page.blocks:
+            for line in block.lines:
+                for word in line.words:
+                    # docTR returns coordinates as (x_min, y_min, x_max, y_max)
+                    # Already normalized to 0-1 range
+                    geometry = word.geometry
+                    
+                    text_block = TextBlock(
+                        text=word.value,
+                        confidence=word.confidence,
+                        x_min=geometry[0][0],
+                        y_min=geometry[0][1],
+                        x_max=geometry[1][0],
+                        y_max=geometry[1][1],
+                        page=page_idx,
+                    )
+                    blocks.append(text_block)
+                    
+                    # Log each block at DEBUG level
+                    logger.debug(
+                        "Block: '%s' conf=%.2f pos=(%.3f, %.3f)",
+                        word.value, word.confidence, geometry[0][0], geometry[0][1],
+                    )
+        
+        logger.debug("Page %d: %d blocks extracted", page_idx, len(blocks))
+        
+        return OCRPage(
+            page_number=page_idx,
+            width=page_width,
+            height=page_height,
+            blocks=blocks,
+        )
+    
     def extract_text_in_region(
         self,
         result: OCRResult,
@@ -417,8 +777,8 @@ class OCREngine:
         matching_blocks.sort(key=lambda b: (b.center_y, b.center_x))
         
         logger.debug(
-            f"Region ({x_min:.2f}, {y_min:.2f}) - ({x_max:.2f}, {y_max:.2f}): "
-            f"{len(matching_blocks)} blocks found"
+            "Region (%.2f, %.2f) - (%.2f, %.2f): %d blocks found",
+            x_min, y_min, x_max, y_max, len(matching_blocks),
         )
         
         return matching_blocks
@@ -10,58 +10,80 @@ Works with any document layout without position-based assumptions.
 """
 
 import logging
+import os
 import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date, datetime
-from decimal import Decimal, InvalidOperation
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
 from eula.domain.models import ExtractedField
 
+try:
+    import re2  # Optional: google-re2 gives linear-time matching
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 
 # =============================================================================
 # Regex Patterns for Common Document Fields
 # =============================================================================
+# All patterns are compiled once at import so extraction calls go straight
+# to the compiled matcher instead of the re module's pattern cache.
+
+def _compile_all(patterns: list[str]) -> tuple[re.Pattern[str], ...]:
+    """Compile field patterns (case-insensitive) in priority order."""
+    return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+
 
 # Invoice/PO/Reference numbers - capture FULL number including prefix
-INVOICE_NUMBER_PATTERNS = [
+INVOICE_NUMBER_PATTERNS = _compile_all([
     r'(?:Invoice\s*No\s*[:\s]*)(\d{5,})',  # Invoice No : 00000003 (InvoiceNow SG)
     r'(?:Invoice\s*No\s*[:\s]*)([A-Z0-9\-]+)',  # Invoice No: ABC-123
     r'(INV[-\s]?\d{4}[-\s]?\d{3,})',  # INV-2024-001 as full match
     r'(?:Invoice\s*#?\s*)([A-Z0-9\-]+)',  # Invoice #12345
     r'(?:Invoice\s+(?:No|Number)[:\s]*)([A-Z0-9\-]+)',  # Invoice Number: ABC-123
     r'#\s*([A-Z]{2,4}\-?\d{4,})',  # #INV-12345
-]
+])
 
-PO_NUMBER_PATTERNS = [
+PO_NUMBER_PATTERNS = _compile_all([
     r'(?:P\.O\.\s*Number\s*[:\s]*)([A-Z0-9\-]+)',  # P.O. Number PO-SG-2023-001 (InvoiceNow)
     r'(?:PO|Purchase\s*Order)[#:\-\s]*([A-Z0-9\-]+)',  # PO-2024-001
     r'(?:P\.?O\.?\s*(?:No|Number|#)?[:\s]*)([A-Z0-9\-]+)',  # P.O. #12345
     r'Order\s*(?:No|Number|#)?[:\s]*([A-Z0-9\-]+)',  # Order #12345
-]
+])
 
-DELIVERY_REF_PATTERNS = [
+DELIVERY_REF_PATTERNS = _compile_all([
     r'(?:Delivery\s+Ref\s*[:\s]*)([A-Z0-9\-]+)',  # Delivery Ref : DEL-SG-2023-001 (InvoiceNow)
     r'(?:DEL|Delivery|DN)[#:\-\s]*([A-Z0-9\-]+)',  # DEL-2024-001
     r'(?:Delivery\s+(?:Note|Ref|Reference)?[:\s]*)([A-Z0-9\-]+)',
     r'(?:Receipt|Received)[#:\-\s]*([A-Z0-9\-]+)',
-]
+])
 
 # Monetary amounts - support multiple currencies
-AMOUNT_PATTERNS = [
+AMOUNT_PATTERNS = _compile_all([
     r'S\$\s*([\d,]+\.?\d{0,2})',  # S$1,000.00 (Singapore)
     r'SGD\s*([\d,]+\.?\d{0,2})',  # SGD 1000.00
     r'SS([\d,]+\.?\d{0,2})',  # SS1,000.00 (OCR misread of S$)
     r'[\$]\s*([\d,]+\.?\d{0,2})',  # $8,000.00
     r'([\d,]+\.?\d{0,2})\s*(?:USD|dollars?|SGD)',  # 8000.00 USD
     r'(?:Total|Amount|Due|Subtotal|Balance)[:\s]*[S\$]*\s*([\d,]+\.?\d{0,2})',  # Total: S$8000
-    r'([\d]{1,3}(?:,\d{3})*\.?\d{0,2})',  # 8,000.00 (general number with commas)
-]
+    # 8,000.00 / 8000.00 (general number: needs comma groups or explicit cents,
+    # so stray integers like phone digits and quantities are not amounts)
+    r'(?<![\d.])(\d{1,3}(?:,\d{3})+\.\d{2}|\d+\.\d{2})(?!\d)',
+])
 
-# Dates - multiple formats
-DATE_PATTERNS = [
+# Shape Decimal() accepts for a cleaned amount capture: 1000, 1000., 1000.5, .5
+PLAIN_NUMBER_PATTERN = re.compile(r'\d+\.?\d*|\.\d+')
+
+# Dates - multiple formats, each paired with its format (see DATE_PARSERS)
+DATE_PATTERNS = tuple((re.compile(p, re.IGNORECASE), fmt) for p, fmt in [
     # ISO format: 2024-01-05
     (r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})', '%Y-%m-%d'),
     # US format: 01/05/2024, 1/5/24
@@ -70,17 +92,294 @@ DATE_PATTERNS = [
     (r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})', '%B %d, %Y'),
     # Short month: Jan 5, 2024
     (r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4})', '%b %d, %Y'),
-]
+])
+
+# Lowercase full and three-letter month names -> month number
+_MONTH_NAMES = (
+    'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december',
+)
+MONTH_NUMBERS = {
+    **{name: i for i, name in enumerate(_MONTH_NAMES, 1)},
+    **{name[:3]: i for i, name in enumerate(_MONTH_NAMES, 1)},
+}
 
 # Quantity patterns
-QUANTITY_PATTERNS = [
+QUANTITY_PATTERNS = _compile_all([
     r'(?:Qty|Quantity|Units?|Received)[:\s]*(\d+)',  # Qty: 50
     r'(\d+)\s*(?:units?|pcs?|items?)',  # 50 units
     r'Total\s+Quantity[:\s]*(\d+)',  # Total Quantity: 200
-]
+])
+
+# Fallback: any bare number after a quantity label
+BARE_NUMBER_PATTERN = re.compile(r'(\d+)')
+
+# Reference numbers to skip when collecting names (e.g., PO-SG-2023-001)
+REFERENCE_NUMBER_PATTERN = re.compile(
+    r'^[A-Z]{2,4}[-\s]?[A-Z0-9]{2,4}[-\s]?\d{3,}', re.IGNORECASE
+)
+
+# Default labels for the reference-number extractors (already lowercase)
+DEFAULT_INVOICE_LABELS = ("invoice", "inv", "invoice no", "invoice #", "invoice number")
+DEFAULT_PO_LABELS = ("po", "purchase order", "po #", "order")
+DEFAULT_DELIVERY_LABELS = ("delivery", "del", "receipt", "reference")
+
+# Labels extract_batch uses for the fields that need them (as in the forensic service)
+DEFAULT_AMOUNT_LABELS = ("total", "amount due", "balance due", "grand total", "total due")
+DEFAULT_DATE_LABELS = ("invoice date", "date", "issued")
+DEFAULT_QUANTITY_LABELS = ("quantity", "qty", "units", "received", "total quantity", "items")
 
+# extract_batch field name -> how to extract it
+BATCH_FIELDS: dict[str, Callable[["SmartFieldExtractor", Any], ExtractedField]] = {
+    "invoice": lambda extractor, result: extractor.extract_invoice_number(result),
+    "po": lambda extractor, result: extractor.extract_po_number(result),
+    "delivery": lambda extractor, result: extractor.extract_delivery_reference(result),
+    "amount": lambda extractor, result: extractor.extract_amount(
+        result, DEFAULT_AMOUNT_LABELS, prefer_largest=True
+    ),
+    "date": lambda extractor, result: extractor.extract_date(result, DEFAULT_DATE_LABELS),
+    "quantity": lambda extractor, result: extractor.extract_quantity(
+        result, DEFAULT_QUANTITY_LABELS
+    ),
+}
 
-@dataclass
+# extract_all field kind -> how to extract it near the given labels
+FIELD_KINDS: dict[str, Callable[["SmartFieldExtractor", Any, Any], ExtractedField]] = {
+    "invoice_number": lambda extractor, result, labels: extractor.extract_invoice_number(
+        result, labels
+    ),
+    "po_number": lambda extractor, result, labels: extractor.extract_po_number(result, labels),
+    "delivery_reference": lambda extractor, result, labels: extractor.extract_delivery_reference(
+        result, labels
+    ),
+    "amount": lambda extractor, result, labels: extractor.extract_amount(result, labels),
+    "date": lambda extractor, result, labels: extractor.extract_date(result, labels),
+    "quantity": lambda extractor, result, labels: extractor.extract_quantity(result, labels),
+    "name": lambda extractor, result, labels: extractor.extract_name(result, labels),
+}
+
+# Name extraction vocabulary, stored lowercase to match lowered block text
+# Common label parts to strip from names
+NAME_LABEL_PREFIXES = (
+    '(seller):', '(buyer):', 'seller:', 'buyer:',
+    'from:', 'to:', 'vendor:', 'customer:', 'company:',
+    'bill to:', 'ship to:', 'sold by:', 'sold to:',
+    'from (buyer):', 'to (vendor):', 'deliver to:',
+    'from (shipper):', 'shipper:', 'recipient:',
+)
+
+# Words to skip - document headers and formatting
+NAME_SKIP_WORDS = (
+    'tax', 'invoice', 'purchase', 'order', 'delivery', 'proof',
+    'gst', 'reg', 'page', 'date', 'number', 'no', 'total',
+    'p.o.', 'po-', 'del-', 'inv-',  # Reference number prefixes
+)
+NAME_SKIP_PATTERN = re.compile('|'.join(re.escape(word) for word in NAME_SKIP_WORDS))
+
+# Bare label words that are never part of a name
+NAME_BARE_LABELS = frozenset({
+    'seller', 'buyer', 'from', 'to', 'vendor', 'customer', 'ship', 'bill',
+})
+
+# Keywords marking the end of a name block
+NAME_STOP_KEYWORDS = ('date:', 'invoice no', 'po:', 'total:', 'amount:', 'qty:', 'phone:', 'fax:')
+NAME_STOP_PATTERN = re.compile('|'.join(re.escape(kw) for kw in NAME_STOP_KEYWORDS))
+
+def _compile_linear(patterns: tuple[re.Pattern[str], ...]) -> tuple | None:
+    """
+    Compile patterns with RE2 if available.
+    
+    Returns None when google-re2 is not installed, in which case callers
+    stay on the stdlib engine. Patterns RE2 cannot express (lookarounds)
+    keep their stdlib compilation.
+    """
+    if re2 is None:
+        return None
+    compiled = []
+    for p in patterns:
+        try:
+            compiled.append(re2.compile("(?i)" + p.pattern))
+        except re2.error:
+            logger.debug("RE2 rejected pattern %r, using stdlib re", p.pattern)
+            compiled.append(p)
+    return tuple(compiled)
+
+
+class CombinedPattern:
+    """
+    A field's alternative patterns merged into one regex.
+    
+    A single lookahead sweep finds every position where any alternative
+    matches; only those positions are then checked against the remaining
+    alternatives. This gives exactly the matches that running each
+    pattern's finditer separately would, without N full passes over the
+    text - a plain ``a|b|c`` alternation would instead let one
+    alternative's match swallow an overlapping match of another.
+    
+    When google-re2 is installed, each alternative is scanned with RE2
+    instead (stdlib re for any RE2 cannot compile). RE2 has no lookahead,
+    so this costs one pass per alternative, but every RE2 pass is
+    guaranteed linear-time - garbled OCR text (long runs of digits, hyphens
+    or commas) cannot trigger backtracking blow-ups.
+    """
+    
+    def __init__(self, patterns: tuple[re.Pattern[str], ...]) -> None:
+        self.patterns = patterns
+        self._linear = _compile_linear(patterns)
+        self.regex = re.compile(
+            "(?=" + "|".join(f"(?P<arm{i}>{p.pattern})" for i, p in enumerate(patterns)) + ")",
+            re.IGNORECASE,
+        )
+        # arm group name -> (alternative index, index of its first capture group)
+        self._arms = {
+            f"arm{i}": (i, self.regex.groupindex[f"arm{i}"] + 1)
+            for i in range(len(patterns))
+        }
+    
+    def scan(self, text: str) -> list[tuple[int, str, int, int]]:
+        """
+        Find all matches as (alternative index, captured value, start, end).
+        
+        Results are ordered by alternative then position, the same order a
+        pattern-by-pattern scan would produce, so earlier (more specific)
+        patterns still win ties.
+        """
+        if self._linear is not None:
+            return [
+                (arm, match.group(1), match.start(), match.end())
+                for arm, pattern in enumerate(self._linear)
+                for match in pattern.finditer(text)
+            ]
+        
+        matches: list[tuple[int, str, int, int]] = []
+        # Per alternative, where its next non-overlapping match may begin
+        resume_at = [0] * len(self.patterns)
+        
+        for candidate in self.regex.finditer(text):
+            pos = candidate.start()
+            first, group = self._arms[candidate.lastgroup]
+            
+            # Alternatives before `first` were tried here and failed
+            if pos >= resume_at[first]:
+                end = candidate.end(group - 1)
+                matches.append((first, candidate.group(group), pos, end))
+                resume_at[first] = end
+            
+            for arm in range(first + 1, len(self.patterns)):
+                if pos < resume_at[arm]:
+                    continue
+                match = self.patterns[arm].match(text, pos)
+                if match:
+                    matches.append((arm, match.group(1), pos, match.end()))
+                    resume_at[arm] = match.end()
+        
+        matches.sort(key=lambda m: (m[0], m[2]))
+        return matches
+
+
+# Fields scanned over the whole document, swept together by _scan_all
+FIELD_PATTERNS: dict[str, tuple[re.Pattern[str], ...]] = {
+    "invoice_number": INVOICE_NUMBER_PATTERNS,
+    "po_number": PO_NUMBER_PATTERNS,
+    "delivery_reference": DELIVERY_REF_PATTERNS,
+    "amount": AMOUNT_PATTERNS,
+    "date": tuple(pattern for pattern, _ in DATE_PATTERNS),
+}
+ALL_FIELDS_COMBINED = CombinedPattern(
+    tuple(pattern for patterns in FIELD_PATTERNS.values() for pattern in patterns)
+)
+# Combined alternative index -> (field name, index within that field)
+_FIELD_ARMS = tuple(
+    (name, i) for name, patterns in FIELD_PATTERNS.items() for i in range(len(patterns))
+)
+
+QUANTITY_COMBINED = CombinedPattern(QUANTITY_PATTERNS)
+
+# Company name fallbacks when no label is found
+COMPANY_NAME_PATTERNS = _compile_all([
+    r'([A-Z][A-Z\s]+(?:PTE\.?\s*LTD\.?|LTD\.?|INC\.?|CORP\.?|LLC))',  # CLEARWATER PTE LTD
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\s+(?:Ltd|Inc|Corp|LLC))',  # Acme Supplies Ltd
+])
+
+
+@lru_cache(maxsize=1024)
+def _parse_amount(raw_value: str) -> Decimal | None:
+    """
+    Parse a captured amount string, or None if it is not a positive number.
+    
+    Cached because the same figures recur within a document (several
+    patterns capture them) and across documents from one template.
+    Decimals are immutable, so sharing cached instances is safe.
+    """
+    cleaned = raw_value.replace(',', '').replace('$', '').strip()
+    # Checked up front so malformed captures never reach Decimal's error path
+    if not PLAIN_NUMBER_PATTERN.fullmatch(cleaned):
+        return None
+    amount = Decimal(cleaned)
+    return amount if amount > 0 else None
+
+
+def _parse_date_part(token: str, limit: int) -> int | None:
+    """Read a one- or two-digit day or month in 1..limit, as strptime does."""
+    if 1 <= len(token) <= 2 and token.isascii() and token.isdigit():
+        value = int(token)
+        if 1 <= value <= limit:
+            return value
+    return None
+
+
+def _build_date(year_text: str, month: int | None, day_text: str) -> date | None:
+    """Assemble a date from parsed parts, or None if any part is invalid."""
+    day = _parse_date_part(day_text, 31)
+    if month is None or day is None:
+        return None
+    if len(year_text) != 4 or not (year_text.isascii() and year_text.isdigit()):
+        return None
+    try:
+        return date(int(year_text), month, day)
+    except ValueError:  # Impossible dates like 02/30/2024
+        return None
+
+
+def _parse_ymd(text: str) -> date | None:
+    """Parse "YYYY/M/D"."""
+    fields = text.split('/')
+    if len(fields) != 3:
+        return None
+    year_text, month_text, day_text = fields
+    return _build_date(year_text, _parse_date_part(month_text, 12), day_text)
+
+
+def _parse_mdy(text: str) -> date | None:
+    """Parse "M/D/YYYY"."""
+    fields = text.split('/')
+    if len(fields) != 3:
+        return None
+    month_text, day_text, year_text = fields
+    return _build_date(year_text, _parse_date_part(month_text, 12), day_text)
+
+
+def _parse_month_name(text: str) -> date | None:
+    """Parse "Month D YYYY" with a full or three-letter month name."""
+    parts = text.split()
+    if len(parts) != 3:
+        return None
+    month_name, day_text, year_text = parts
+    return _build_date(year_text, MONTH_NUMBERS.get(month_name.lower()), day_text)
+
+
+# DATE_PATTERNS format -> direct parser for its normalized captures
+# (separators as "/", commas dropped)
+DATE_PARSERS: dict[str, Callable[[str], date | None]] = {
+    '%Y-%m-%d': _parse_ymd,
+    '%m/%d/%Y': _parse_mdy,
+    '%B %d, %Y': _parse_month_name,
+    '%b %d, %Y': _parse_month_name,
+}
+_DATE_ARM_PARSERS = tuple(DATE_PARSERS[fmt] for _, fmt in DATE_PATTERNS)
+
+
+@dataclass(slots=True)
 class PatternMatch:
     """A regex pattern match with metadata."""
     value: str
@@ -110,6 +409,12 @@ class SmartFieldExtractor:
             proximity_window: How many text blocks to search after a label match
         """
         self.proximity_window = proximity_window
+        # Memo for the most recently seen document: field matches, its
+        # lowercased text and the first position of each lowercased label
+        self._doc_text: str | None = None
+        self._doc_matches: dict[str, list[tuple[int, str, int, int]]] | None = None
+        self._doc_lower: str | None = None
+        self._doc_labels: dict[str, int] = {}
     
     def extract_invoice_number(
         self,
@@ -117,7 +422,7 @@ class SmartFieldExtractor:
         labels: list[str] | None = None,
     ) -> ExtractedField:
         """Extract invoice number using regex patterns."""
-        labels = labels or ["invoice", "inv", "invoice no", "invoice #", "invoice number"]
+        labels = labels or DEFAULT_INVOICE_LABELS
         return self._extract_with_patterns(
             ocr_result,
             INVOICE_NUMBER_PATTERNS,
@@ -131,7 +436,7 @@ class SmartFieldExtractor:
         labels: list[str] | None = None,
     ) -> ExtractedField:
         """Extract purchase order number."""
-        labels = labels or ["po", "purchase order", "po #", "order"]
+        labels = labels or DEFAULT_PO_LABELS
         return self._extract_with_patterns(
             ocr_result,
             PO_NUMBER_PATTERNS,
@@ -145,7 +450,7 @@ class SmartFieldExtractor:
         labels: list[str] | None = None,
     ) -> ExtractedField:
         """Extract delivery reference number."""
-        labels = labels or ["delivery", "del", "receipt", "reference"]
+        labels = labels or DEFAULT_DELIVERY_LABELS
         return self._extract_with_patterns(
             ocr_result,
             DELIVERY_REF_PATTERNS,
@@ -170,20 +475,13 @@ class SmartFieldExtractor:
         full_text = ocr_result.full_text
         
         # Find all amounts in the text
-        all_amounts: list[tuple[Decimal, float, str]] = []  # (value, confidence, raw)
-        
-        for pattern in AMOUNT_PATTERNS:
-            for match in re.finditer(pattern, full_text, re.IGNORECASE):
-                try:
-                    raw_value = match.group(1)
-                    # Clean and parse
-                    cleaned = raw_value.replace(',', '').replace('$', '').strip()
-                    if cleaned and cleaned != '.':
-                        amount = Decimal(cleaned)
-                        if amount > 0:
-                            all_amounts.append((amount, 0.85, raw_value))
-                except (InvalidOperation, ValueError, IndexError):
-                    continue
+        # (value, confidence, raw, position)
+        all_amounts: list[tuple[Decimal, float, str, int]] = []
+        
+        for _, raw_value, start, _ in self._scan_all(full_text)["amount"]:
+            amount = _parse_amount(raw_value)
+            if amount is not None:
+                all_amounts.append((amount, 0.85, raw_value, start))
         
         if not all_amounts:
             logger.debug("No amounts found in text")
@@ -192,26 +490,13 @@ class SmartFieldExtractor:
         # Find amounts near labels
         scored_amounts: list[tuple[Decimal, float, str]] = []
         
-        for label in labels:
-            label_pos = full_text.lower().find(label.lower())
-            if label_pos == -1:
-                continue
-            
-            # Get text window after label
-            window_text = full_text[label_pos:label_pos + 200]
-            
-            for pattern in AMOUNT_PATTERNS:
-                for match in re.finditer(pattern, window_text, re.IGNORECASE):
-                    try:
-                        raw_value = match.group(1)
-                        cleaned = raw_value.replace(',', '').replace('$', '').strip()
-                        if cleaned and cleaned != '.':
-                            amount = Decimal(cleaned)
-                            if amount > 0:
-                                # Higher confidence for amounts near labels
-                                scored_amounts.append((amount, 0.95, raw_value))
-                    except (InvalidOperation, ValueError, IndexError):
-                        continue
+        for _, label_pos in self._locate_labels(ocr_result, labels):
+            # Reuse the document pass: take amounts starting within 200 chars after the label
+            window_end = label_pos + 200
+            for amount, _, raw_value, start in all_amounts:
+                if label_pos <= start < window_end:
+                    # Higher confidence for amounts near labels
+                    scored_amounts.append((amount, 0.95, raw_value))
         
         # Pick the best amount
         if scored_amounts:
@@ -247,26 +532,14 @@ class SmartFieldExtractor:
         # Find all dates in the text with their positions
         all_dates: list[tuple[date, float, str, int]] = []  # (date, conf, raw, position)
         
-        for pattern, fmt in DATE_PATTERNS:
-            for match in re.finditer(pattern, full_text, re.IGNORECASE):
-                try:
-                    raw_value = match.group(1)
-                    # Normalize separators and newlines
-                    normalized = raw_value.replace('-', '/').replace(',', '').replace('\n', ' ')
-                    
-                    # Try parsing with the expected format
-                    parsed = None
-                    for try_fmt in [fmt, '%B %d %Y', '%b %d %Y', '%m/%d/%Y', '%Y/%m/%d']:
-                        try:
-                            parsed = datetime.strptime(normalized, try_fmt).date()
-                            break
-                        except ValueError:
-                            continue
-                    
-                    if parsed:
-                        all_dates.append((parsed, 0.85, raw_value, match.start()))
-                except (ValueError, IndexError):
-                    continue
+        for arm, raw_value, start, _ in self._scan_all(full_text)["date"]:
+            # Normalize separators and newlines
+            normalized = raw_value.replace('-', '/').replace(',', '').replace('\n', ' ')
+            
+            # Each pattern's captures have one shape, so one parser applies
+            parsed = _DATE_ARM_PARSERS[arm](normalized)
+            if parsed:
+                all_dates.append((parsed, 0.85, raw_value, start))
         
         if not all_dates:
             logger.debug("No dates found in text")
@@ -276,25 +549,16 @@ class SmartFieldExtractor:
         # Sort labels by specificity (longer = more specific = check first)
         sorted_labels = sorted(labels, key=len, reverse=True)
         
-        for label in sorted_labels:
-            # Find the label in text
-            label_lower = label.lower()
-            text_lower = full_text.lower()
-            label_pos = text_lower.find(label_lower)
-            
-            if label_pos == -1:
-                continue
-            
-            # Find the closest date AFTER this label
-            dates_after_label = [
-                (d, conf, raw, pos) 
-                for d, conf, raw, pos in all_dates 
-                if pos > label_pos and pos < label_pos + 150  # Within 150 chars
-            ]
+        # Stable sort keeps pattern order among dates at the same position
+        dates_by_pos = sorted(all_dates, key=lambda x: x[3])
+        positions = [x[3] for x in dates_by_pos]
+        
+        for label, label_pos in self._locate_labels(ocr_result, sorted_labels):
+            # The closest date AFTER this label is the first one past it
+            idx = bisect_right(positions, label_pos)
             
-            if dates_after_label:
-                # Get the closest one
-                closest = min(dates_after_label, key=lambda x: x[3] - label_pos)
+            if idx < len(positions) and positions[idx] < label_pos + 150:  # Within 150 chars
+                closest = dates_by_pos[idx]
                 logger.info(f"Date extracted for '{label}': {closest[0]} (raw: '{closest[2][:20]}')")
                 return ExtractedField(value=closest[0], confidence=0.95, raw_text=closest[2])
         
@@ -313,39 +577,25 @@ class SmartFieldExtractor:
     ) -> ExtractedField:
         """Extract quantity/count field."""
         full_text = ocr_result.full_text
+        label_positions = [pos for _, pos in self._locate_labels(ocr_result, labels)]
         
         # Find quantities near labels
-        for label in labels:
-            label_pos = full_text.lower().find(label.lower())
-            if label_pos == -1:
-                continue
-            
+        for label_pos in label_positions:
             window_text = full_text[label_pos:label_pos + 100]
             
-            for pattern in QUANTITY_PATTERNS:
-                match = re.search(pattern, window_text, re.IGNORECASE)
-                if match:
-                    try:
-                        qty = Decimal(match.group(1))
-                        logger.info(f"Quantity extracted: {qty}")
-                        return ExtractedField(value=qty, confidence=0.9, raw_text=match.group(1))
-                    except (InvalidOperation, ValueError):
-                        continue
+            # Every quantity pattern captures \d+, which Decimal always accepts
+            for _, raw_value, _, _ in QUANTITY_COMBINED.scan(window_text):
+                qty = Decimal(raw_value)
+                logger.info(f"Quantity extracted: {qty}")
+                return ExtractedField(value=qty, confidence=0.9, raw_text=raw_value)
         
         # Fallback: find any number after labels
-        for label in labels:
-            label_pos = full_text.lower().find(label.lower())
-            if label_pos == -1:
-                continue
-            
+        for label_pos in label_positions:
             window_text = full_text[label_pos:label_pos + 50]
-            match = re.search(r'(\d+)', window_text)
+            match = BARE_NUMBER_PATTERN.search(window_text)
             if match:
-                try:
-                    qty = Decimal(match.group(1))
-                    return ExtractedField(value=qty, confidence=0.7, raw_text=match.group(1))
-                except (InvalidOperation, ValueError):
-                    continue
+                raw_value = match.group(1)
+                return ExtractedField(value=Decimal(raw_value), confidence=0.7, raw_text=raw_value)
         
         return ExtractedField(value=Decimal("0"), confidence=0.0, raw_text="")
     
@@ -361,42 +611,22 @@ class SmartFieldExtractor:
         blocks = ocr_result.all_blocks
         full_text = ocr_result.full_text
         
-        # Common label parts to strip from names
-        label_prefixes = [
-            '(seller):', '(buyer):', 'seller:', 'buyer:', 
-            'from:', 'to:', 'vendor:', 'customer:', 'company:',
-            'bill to:', 'ship to:', 'sold by:', 'sold to:',
-            'from (buyer):', 'to (vendor):', 'deliver to:',
-            'from (shipper):', 'shipper:', 'recipient:',
-        ]
-        
-        # Words to skip - document headers and formatting
-        skip_words = [
-            'tax', 'invoice', 'purchase', 'order', 'delivery', 'proof',
-            'gst', 'reg', 'page', 'date', 'number', 'no', 'total',
-            'p.o.', 'po-', 'del-', 'inv-',  # Reference number prefixes
-        ]
-        
-        # Pattern for reference numbers to skip
-        import re
-        ref_pattern = re.compile(r'^[A-Z]{2,4}[-\s]?[A-Z0-9]{2,4}[-\s]?\d{3,}', re.IGNORECASE)
+        labels_lower = [label.lower() for label in labels]
+        # (stripped text, lowercased) per block, shared by label and name scans
+        block_texts = [(text, text.lower()) for text in (block.text.strip() for block in blocks)]
         
-        for i, block in enumerate(blocks):
-            text_lower = block.text.lower().strip()
-            
-            for label in labels:
-                if label.lower() in text_lower:
+        for i, (_, text_lower) in enumerate(block_texts):
+            for label, label_lower in zip(labels, labels_lower):
+                if label_lower in text_lower:
                     # Get the next few blocks as potential names
                     name_parts = []
                     total_conf = 0
                     
                     for j in range(i + 1, min(i + 6, len(blocks))):
-                        next_block = blocks[j]
-                        next_text = next_block.text.strip()
-                        next_lower = next_text.lower()
+                        next_text, next_lower = block_texts[j]
                         
                         # Stop at common delimiters
-                        if any(kw in next_lower for kw in ['date:', 'invoice no', 'po:', 'total:', 'amount:', 'qty:', 'phone:', 'fax:']):
+                        if NAME_STOP_PATTERN.search(next_lower):
                             break
                         
                         # Skip short words that are likely labels
@@ -404,26 +634,28 @@ class SmartFieldExtractor:
                             continue
                         
                         # Skip if it's just a label prefix
-                        if next_lower.rstrip(':') in ['seller', 'buyer', 'from', 'to', 'vendor', 'customer', 'ship', 'bill']:
+                        if next_lower.rstrip(':') in NAME_BARE_LABELS:
                             continue
                         
                         # Skip document header words and reference prefixes
-                        if any(skip in next_lower for skip in skip_words):
+                        if NAME_SKIP_PATTERN.search(next_lower):
                             continue
                         
                         # Skip reference numbers (e.g., PO-SG-2023-001)
-                        if ref_pattern.match(next_text):
+                        if REFERENCE_NUMBER_PATTERN.match(next_text):
                             continue
                             
                         # Clean the part - remove label prefixes
                         cleaned = next_text
-                        for prefix in label_prefixes:
-                            if cleaned.lower().startswith(prefix):
+                        cleaned_lower = next_lower
+                        for prefix in NAME_LABEL_PREFIXES:
+                            if cleaned_lower.startswith(prefix):
                                 cleaned = cleaned[len(prefix):].strip()
+                                cleaned_lower = cleaned.lower()
                         
                         if cleaned and len(cleaned) > 1:
                             name_parts.append(cleaned)
-                            total_conf += next_block.confidence
+                            total_conf += blocks[j].confidence
                     
                     if name_parts:
                         name = ' '.join(name_parts[:3])  # Max 3 parts
@@ -432,68 +664,204 @@ class SmartFieldExtractor:
                         return ExtractedField(value=name, confidence=avg_conf, raw_text=name)
         
         # Fallback: Look for company name patterns (e.g., "XYZ PTE LTD" at end)
-        company_patterns = [
-            r'([A-Z][A-Z\s]+(?:PTE\.?\s*LTD\.?|LTD\.?|INC\.?|CORP\.?|LLC))',  # CLEARWATER PTE LTD
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\s+(?:Ltd|Inc|Corp|LLC))',  # Acme Supplies Ltd
-        ]
-        
-        for pattern in company_patterns:
-            matches = list(re.finditer(pattern, full_text, re.IGNORECASE))
-            if matches:
+        for pattern in COMPANY_NAME_PATTERNS:
+            match = pattern.search(full_text)
+            if match:
                 # Return the first company name found
-                name = matches[0].group(1).strip()
+                name = match.group(1).strip()
                 logger.info(f"Name extracted via pattern: '{name}'")
                 return ExtractedField(value=name, confidence=0.75, raw_text=name)
         
         return ExtractedField(value="UNKNOWN", confidence=0.0, raw_text="")
 
     
+    def extract_all(
+        self,
+        ocr_result,
+        spec: dict[str, tuple[str, list[str] | None]],
+    ) -> dict[str, ExtractedField]:
+        """
+        Extract several fields from one document.
+        
+        The pattern fields share one sweep over the document text and label
+        positions are looked up once, however many fields are requested.
+        
+        Args:
+            ocr_result: OCR output
+            spec: Output name -> (kind from FIELD_KINDS, labels to search
+                near). Labels may be None for the number fields, which then
+                use their default labels.
+        
+        Returns:
+            {output name: ExtractedField}, in spec order
+        
+        Example:
+            fields = extractor.extract_all(ocr_result, {
+                "invoice_number": ("invoice_number", None),
+                "total": ("amount", ["total", "amount due"]),
+                "due_date": ("date", ["due date", "pay by"]),
+            })
+        """
+        unknown = [kind for kind, _ in spec.values() if kind not in FIELD_KINDS]
+        if unknown:
+            raise ValueError(f"Unknown field kinds: {unknown}")
+        
+        return {
+            name: FIELD_KINDS[kind](self, ocr_result, labels)
+            for name, (kind, labels) in spec.items()
+        }
+    
+    @classmethod
+    def extract_batch(
+        cls,
+        ocr_results: Iterable,
+        fields: Iterable[str] = ("invoice", "po", "amount", "date"),
+        proximity_window: int = 5,
+        max_workers: int | None = None,
+    ) -> list[dict[str, ExtractedField]]:
+        """
+        Extract the same fields from many documents in parallel.
+        
+        Documents are independent, so they are spread over a thread pool;
+        each gets its own extractor, since the per-document memo is not
+        shared between threads.
+        
+        Args:
+            ocr_results: OCR output for each document
+            fields: Names from BATCH_FIELDS to extract
+            proximity_window: Passed to each document's extractor
+            max_workers: Thread count (defaults to the CPU count)
+        
+        Returns:
+            One {field name: ExtractedField} dict per document, in input order
+        """
+        fields = tuple(fields)
+        unknown = [name for name in fields if name not in BATCH_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown batch fields: {unknown}")
+        
+        def extract_one(ocr_result) -> dict[str, ExtractedField]:
+            extractor = cls(proximity_window=proximity_window)
+            return {name: BATCH_FIELDS[name](extractor, ocr_result) for name in fields}
+        
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(extract_one, ocr_results))
+    
+    def _scan_all(self, full_text: str) -> dict[str, list[tuple[int, str, int, int]]]:
+        """
+        Run every field's patterns over the document in one sweep.
+        
+        Returns field name -> (alternative index, captured value, start, end)
+        matches. The result for the last document is kept, so extracting
+        several fields from the same text scans it only once.
+        """
+        self._use_document(full_text)
+        if self._doc_matches is not None:
+            return self._doc_matches
+        
+        by_field: dict[str, list[tuple[int, str, int, int]]] = {name: [] for name in FIELD_PATTERNS}
+        for arm, value, start, end in ALL_FIELDS_COMBINED.scan(full_text):
+            name, field_arm = _FIELD_ARMS[arm]
+            by_field[name].append((field_arm, value, start, end))
+        
+        self._doc_matches = by_field
+        return by_field
+    
+    def _locate_labels(self, ocr_result, labels) -> list[tuple[str, int]]:
+        """
+        Find the first case-insensitive occurrence of each label.
+        
+        Returns (label, position) for the labels present, in the given
+        order. Positions are remembered per document, since the same labels
+        ("total", "date", ...) are looked up by several extractors.
+        """
+        self._use_document(ocr_result.full_text)
+        text_lower = self._text_lower(ocr_result)
+        known = self._doc_labels
+        
+        located: list[tuple[str, int]] = []
+        for label in labels:
+            label_lower = label.lower()
+            label_pos = known.get(label_lower)
+            if label_pos is None:
+                label_pos = known[label_lower] = text_lower.find(label_lower)
+            if label_pos != -1:
+                located.append((label, label_pos))
+        return located
+    
+    def _text_lower(self, ocr_result) -> str:
+        """
+        Lowercased document text, computed at most once per document.
+        
+        OCRResult caches it as full_text_lower; other result objects (test
+        doubles, results loaded from JSON) fall back to the per-document
+        memo. Call _use_document first.
+        """
+        text_lower = getattr(ocr_result, "full_text_lower", None)
+        if text_lower is None:
+            if self._doc_lower is None:
+                self._doc_lower = ocr_result.full_text.lower()
+            text_lower = self._doc_lower
+        return text_lower
+    
+    def _use_document(self, full_text: str) -> None:
+        """Reset the per-document memo when a different text comes in."""
+        if full_text is not self._doc_text and full_text != self._doc_text:
+            self._doc_text = full_text
+            self._doc_matches = None
+            self._doc_lower = None
+            self._doc_labels = {}
+    
     def _extract_with_patterns(
         self,
         ocr_result,
-        patterns: list[str],
+        patterns: tuple[re.Pattern[str], ...],
         labels: list[str],
         field_name: str,
     ) -> ExtractedField:
         """Generic extraction using regex patterns + label proximity."""
         full_text = ocr_result.full_text
         
-        # Find all matches for all patterns
-        all_matches: list[PatternMatch] = []
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, full_text, re.IGNORECASE):
-                try:
-                    value = match.group(1)
-                    if value and len(value) >= 2:  # Minimum length
-                        all_matches.append(PatternMatch(
-                            value=value,
-                            pattern=pattern,
-                            start=match.start(),
-                            end=match.end(),
-                            confidence=0.85,
-                        ))
-                except IndexError:
-                    continue
+        # Matches for all patterns come from the shared document sweep, in
+        # pattern order so ties still go to the more specific pattern
+        candidates = [
+            candidate for candidate in self._scan_all(full_text)[field_name]
+            if candidate[1] and len(candidate[1]) >= 2  # Minimum length
+        ]
         
-        if not all_matches:
+        if not candidates:
             logger.warning(f"No {field_name} patterns matched")
             return ExtractedField(value="UNKNOWN", confidence=0.0, raw_text="")
         
-        # Boost confidence for matches near labels
-        for label in labels:
-            label_pos = full_text.lower().find(label.lower())
-            if label_pos == -1:
-                continue
+        # Sorted label positions let each candidate count nearby labels by bisect
+        label_positions = sorted(pos for _, pos in self._locate_labels(ocr_result, labels))
+        
+        best_idx = 0
+        best_confidence = -1.0
+        for i, (_, _, start, _) in enumerate(candidates):
+            # Each label within 100 chars of the match boosts confidence
+            nearby = (
+                bisect_left(label_positions, start + 100)
+                - bisect_right(label_positions, start - 100)
+            )
+            confidence = 0.85
+            for _ in range(nearby):
+                confidence = min(0.98, confidence + 0.1)
             
-            for match in all_matches:
-                # If match is within 100 chars of label, boost confidence
-                distance = abs(match.start - label_pos)
-                if distance < 100:
-                    match.confidence = min(0.98, match.confidence + 0.1)
-        
-        # Pick the best match
-        best = max(all_matches, key=lambda m: m.confidence)
+            # Pick the best match; on ties the earlier (more specific) pattern wins
+            if confidence > best_confidence:
+                best_idx, best_confidence = i, confidence
+                if confidence >= 0.98:
+                    break  # Capped - no later candidate can beat it
+        
+        arm, value, start, end = candidates[best_idx]
+        best = PatternMatch(
+            value=value,
+            pattern=patterns[arm].pattern,
+            start=start,
+            end=end,
+            confidence=best_confidence,
+        )
         
         logger.info(f"{field_name} extracted: '{best.value}' (conf: {best.confidence:.0%})")
         return ExtractedField(value=best.value, confidence=best.confidence, raw_text=best.value)
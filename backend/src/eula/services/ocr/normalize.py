@@ -15,9 +15,11 @@ Design Decisions:
 
 import logging
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any
 
 from eula.domain.models import BoundingBox, ExtractedField
@@ -41,9 +43,20 @@ OCR_CHAR_FIXES = {
     "G": "6",
 }
 
+# Translation table applying every OCR_CHAR_FIXES substitution in one pass
+OCR_CHAR_TRANSLATION = str.maketrans(OCR_CHAR_FIXES)
+
+# Any character OCR_CHAR_FIXES would change
+OCR_CONFUSABLE_PATTERN = re.compile("[" + "".join(OCR_CHAR_FIXES) + "]")
+
 # Currency symbols to strip
 CURRENCY_SYMBOLS = ["$", "€", "£", "¥", "₹", "CHF", "USD", "EUR", "GBP"]
 
+# All currency symbols in one alternation, longest first
+CURRENCY_SYMBOL_PATTERN = re.compile(
+    "|".join(re.escape(symbol) for symbol in sorted(CURRENCY_SYMBOLS, key=len, reverse=True))
+)
+
 # Date format patterns to try (in order of preference)
 DATE_FORMATS = [
     "%Y-%m-%d",      # ISO format: 2024-01-15
@@ -57,8 +70,232 @@ DATE_FORMATS = [
     "%B %d, %Y",     # January 15, 2024
 ]
 
+# Lowercase full and three-letter month names -> month number
+_MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+MONTH_NUMBERS = {
+    **{name: i for i, name in enumerate(_MONTH_NAMES, 1)},
+    **{name[:3]: i for i, name in enumerate(_MONTH_NAMES, 1)},
+}
+
+# What each DATE_FORMATS directive accepts - the same sub-patterns strptime uses
+_DATE_DIRECTIVES = {
+    "Y": r"\d\d\d\d",
+    "m": r"1[0-2]|0[1-9]|[1-9]",
+    "d": r"3[01]|[12]\d|0[1-9]|[1-9]| [1-9]",
+    "b": "|".join(name[:3] for name in _MONTH_NAMES),
+    "B": "|".join(_MONTH_NAMES),
+}
+
+
+def _date_layout_pattern(index: int, fmt: str) -> str:
+    """Translate one DATE_FORMATS entry into a named regex alternative."""
+    parts = []
+    for piece in re.split(r"(%[YmdbB])", fmt):
+        if piece.startswith("%"):
+            parts.append(f"(?P<f{index}{piece[1]}>{_DATE_DIRECTIVES[piece[1]]})")
+        elif piece:
+            # Whitespace in a format matches any run of whitespace, as in strptime
+            parts.append(r"\s+".join(re.escape(word) for word in piece.split(" ")))
+    return f"(?P<f{index}>{''.join(parts)})"
+
+
+# Every DATE_FORMATS layout in one regex; alternatives keep the format order,
+# and the outer group that matched (lastgroup "f<index>") names the layout
+DATE_LAYOUT_PATTERN = re.compile(
+    "|".join(_date_layout_pattern(i, fmt) for i, fmt in enumerate(DATE_FORMATS)),
+    re.IGNORECASE,
+)
+
+# Sections that look numeric: digits, separators and their OCR look-alikes
+NUMERIC_SECTION_PATTERN = re.compile(r"[\dSsOolIBZgG,.\-]+")
+
+# Anything left in an amount that is not a digit or decimal point
+NON_NUMERIC_PATTERN = re.compile(r"[^\d.]")
+
+# The same for amounts written with a decimal comma
+DECIMAL_COMMA_STRIP_PATTERN = re.compile(r"[^\d,]")
+
+# Fallback date components: 15/01/2024, 1-5-24, 31.12.2023
+DATE_COMPONENTS_PATTERN = re.compile(r"(\d{1,2})[/\-.](\d{1,2})[/\-.](\d{2,4})")
+
+# Leading numeric portion of a quantity ("50 pcs" -> "50")
+QUANTITY_NUMBER_PATTERN = re.compile(r"[\d,]+\.?\d*")
+
+# C0 and C1 control characters
+CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x1f\x7f-\x9f]")
+
+# Sanity limits and the fallback value; Decimal is immutable, so these are shared
+MAX_AMOUNT = Decimal("1000000000")  # 1 billion
+MAX_QUANTITY = Decimal("1000000")
+ZERO = Decimal(0)
+
+
+def _fix_numeric_section(match: re.Match) -> str:
+    """Apply OCR character fixes to one numeric-looking section."""
+    return match.group(0).translate(OCR_CHAR_TRANSLATION)
+
+
+def _fix_ocr_errors(text: str) -> str:
+    """
+    Fix common OCR character recognition errors.
+    
+    Only applies fixes in numeric contexts to avoid
+    corrupting actual text.
+    """
+    # Clean OCR (the common case) has nothing to fix
+    if not OCR_CONFUSABLE_PATTERN.search(text):
+        return text
+    
+    # Match sections that look numeric (digits, decimals, commas plus OCR errors)
+    # and fix errors within them
+    return NUMERIC_SECTION_PATTERN.sub(_fix_numeric_section, text)
+
+
+def _clean_amount(text: str) -> str:
+    """Reduce amount text to the digits and decimal points Decimal() parses."""
+    # Strip currency symbols
+    cleaned = CURRENCY_SYMBOL_PATTERN.sub("", text.strip()).strip()
+    
+    # Fix common OCR errors in numeric context
+    cleaned = _fix_ocr_errors(cleaned)
+    
+    # Handle European vs US number format in one look
+    # European: 1.234,56 (comma after the last period) or 12,34 (one
+    # comma, two digits after it) -> the comma is the decimal point
+    # US: 1,234.56 -> commas are thousands separators
+    comma = cleaned.rfind(",")
+    if comma != -1:
+        period = cleaned.rfind(".")
+        if period != -1:
+            decimal_comma = comma > period
+        else:
+            decimal_comma = cleaned.count(",") == 1 and len(cleaned) - comma == 3
+        if decimal_comma:
+            # Keep digits and the comma, which becomes the decimal point
+            return DECIMAL_COMMA_STRIP_PATTERN.sub("", cleaned).replace(",", ".")
+    
+    # Keep digits and the decimal point; thousands commas go with the rest
+    return NON_NUMERIC_PATTERN.sub("", cleaned)
+
+
+def _parse_date_layout(text: str) -> date | None:
+    """
+    Parse text in any of the DATE_FORMATS layouts.
+    
+    Equivalent to trying datetime.strptime with each format in turn:
+    the earliest format that fits wins. An impossible date (e.g. 30
+    Feb) can never be rescued by a later format, so it returns None.
+    """
+    match = DATE_LAYOUT_PATTERN.fullmatch(text)
+    if match is None:
+        return None
+    
+    layout = match.lastgroup
+    parts = match.groupdict()
+    month_text = parts.get(f"{layout}m") or parts.get(f"{layout}b") or parts[f"{layout}B"]
+    month = MONTH_NUMBERS[month_text.lower()] if month_text.isalpha() else int(month_text)
+    try:
+        return date(int(parts[f"{layout}Y"]), month, int(parts[f"{layout}d"]))
+    except ValueError:
+        return None
+
+
+# =============================================================================
+# Cached normalization cores
+# =============================================================================
+# Invoices repeat the same strings ("0.00", unit prices, header text) within
+# and across documents. The text-only part of each normalization is cached
+# here; the FieldNormalizer methods add confidence, location and logging.
+# Cached values (Decimal, date, str) are immutable, so sharing them is safe.
+
+@lru_cache(maxsize=4096)
+def _amount_core(text: str) -> tuple[Decimal, str | None]:
+    """Parse an amount, returning (value, parse error or None)."""
+    try:
+        return Decimal(_clean_amount(text)), None
+    except (InvalidOperation, ValueError) as e:
+        return ZERO, str(e)
+
+
+@lru_cache(maxsize=4096)
+def _date_core(text: str) -> tuple[date, float] | None:
+    """
+    Parse a date, returning (value, confidence factor), or None.
+    
+    The factor is 1.0 for a known layout and 0.8 for the component fallback.
+    """
+    cleaned = _fix_ocr_errors(text.strip())
+    
+    # Match all date formats at once
+    parsed = _parse_date_layout(cleaned)
+    if parsed is not None:
+        return parsed, 1.0
+    
+    # If all formats fail, try extracting date components
+    date_match = DATE_COMPONENTS_PATTERN.search(cleaned)
+    if date_match:
+        try:
+            d, m, y = date_match.groups()
+            year = int(y)
+            if year < 100:
+                year += 2000
+            
+            # Try both day/month orders
+            try:
+                parsed_date = date(year, int(m), int(d))
+            except ValueError:
+                parsed_date = date(year, int(d), int(m))
+            
+            return parsed_date, 0.8  # Lower confidence for fallback
+        except ValueError:
+            pass
+    
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _quantity_core(text: str) -> tuple[Decimal, str | None]:
+    """Parse a quantity, returning (value, parse error or None)."""
+    cleaned = _fix_ocr_errors(text.strip())
+    
+    # Extract numeric portion (ignore trailing units like "pcs", "units")
+    match = QUANTITY_NUMBER_PATTERN.match(cleaned)
+    if match:
+        cleaned = match.group(0)
+    
+    # Remove thousands separators
+    cleaned = cleaned.replace(",", "")
+    
+    try:
+        value = Decimal(cleaned)
+    except (InvalidOperation, ValueError) as e:
+        return ZERO, str(e)
+    
+    # Validate reasonable range for quantity
+    if value < 0:
+        value = abs(value)  # Assume positive
+    return value, None
+
+
+@lru_cache(maxsize=4096)
+def _string_core(text: str) -> str:
+    """Remove control characters and collapse whitespace."""
+    # Already clean (the common case): printable text has no control
+    # characters, and its only whitespace is the plain space
+    if text.isprintable() and "  " not in text and text == text.strip():
+        return text
+    
+    # Remove control characters
+    cleaned = CONTROL_CHARS_PATTERN.sub("", text)
+    
+    # Normalize whitespace
+    return " ".join(cleaned.split())
+
 
-@dataclass
+@dataclass(slots=True)
 class NormalizationResult[T]:
     """Result of normalizing a raw text value."""
     value: T | None
@@ -126,53 +363,17 @@ class FieldNormalizer:
         """
         raw_text = text
         errors: list[str] = []
+        value, parse_error = _amount_core(text)
         
-        # Strip currency symbols
-        cleaned = text.strip()
-        for symbol in CURRENCY_SYMBOLS:
-            cleaned = cleaned.replace(symbol, "")
-        cleaned = cleaned.strip()
-        
-        # Fix common OCR errors in numeric context
-        cleaned = self._fix_ocr_errors(cleaned)
-        
-        # Handle European vs US number format
-        # European: 1.234,56 -> need to swap
-        # US: 1,234.56 -> standard
-        if "," in cleaned and "." in cleaned:
-            # Check which comes last
-            if cleaned.rindex(",") > cleaned.rindex("."):
-                # European format: swap comma and period
-                cleaned = cleaned.replace(".", "").replace(",", ".")
-            else:
-                # US format: remove commas
-                cleaned = cleaned.replace(",", "")
-        elif "," in cleaned:
-            # Could be thousands separator or decimal
-            # If exactly 2 digits after comma, treat as decimal
-            parts = cleaned.split(",")
-            if len(parts) == 2 and len(parts[1]) == 2:
-                cleaned = cleaned.replace(",", ".")
-            else:
-                cleaned = cleaned.replace(",", "")
-        
-        # Remove any remaining non-numeric chars except decimal point
-        cleaned = re.sub(r"[^\d.]", "", cleaned)
-        
-        # Parse to Decimal
-        try:
-            value = Decimal(cleaned)
-            
+        if parse_error is None:
             # Validate reasonable range
             if value < 0:
                 errors.append("Negative amount detected")
-            if value > Decimal("1000000000"):  # 1 billion
+            if value > MAX_AMOUNT:
                 errors.append("Unusually large amount")
-                
-        except (InvalidOperation, ValueError) as e:
-            logger.warning(f"Failed to parse amount '{text}': {e}")
-            errors.append(f"Parse error: {e}")
-            value = Decimal("0")
+        else:
+            logger.warning(f"Failed to parse amount '{text}': {parse_error}")
+            errors.append(f"Parse error: {parse_error}")
         
         return ExtractedField(
             value=value,
@@ -181,6 +382,46 @@ class FieldNormalizer:
             raw_text=raw_text,
         )
     
+    def normalize_amounts_batch(self, texts: Iterable[str]) -> list[Decimal]:
+        """
+        Parse many amount strings at once, e.g. a table's amount column.
+        
+        Each distinct string is normalized once; repeats (a unit price on
+        every line, "0.00" subtotals) reuse the first result.
+        
+        Args:
+            texts: Raw OCR texts
+            
+        Returns:
+            Decimal values in input order
+        """
+        parsed: dict[str, Decimal] = {}
+        values: list[Decimal] = []
+        for text in texts:
+            value = parsed.get(text)
+            if value is None:
+                value = parsed[text] = self.normalize_amount(text).value
+            values.append(value)
+        return values
+    
+    def normalize_amount_units(self, text: str) -> tuple[int, int] | None:
+        """
+        Parse a monetary amount to integer minor units.
+        
+        Same cleanup as normalize_amount, without building a Decimal, for
+        callers that only compare or total amounts. The value is
+        units / 10**scale, e.g. "$1,234.56" -> (123456, 2).
+        
+        Returns:
+            (units, scale), or None if the text holds no amount
+        """
+        whole, _, fraction = _clean_amount(text).partition(".")
+        digits = whole + fraction
+        # isdigit() rejects both an empty string and a second decimal point
+        if not digits.isdigit():
+            return None
+        return int(digits), len(fraction)
+    
     def normalize_date(
         self,
         text: str,
@@ -201,47 +442,16 @@ class FieldNormalizer:
             ExtractedField with date value
         """
         raw_text = text
-        cleaned = text.strip()
-        
-        # Fix OCR errors
-        cleaned = self._fix_ocr_errors(cleaned)
-        
-        # Try each date format
-        for fmt in DATE_FORMATS:
-            try:
-                parsed = datetime.strptime(cleaned, fmt)
-                return ExtractedField(
-                    value=parsed.date(),
-                    confidence=confidence,
-                    bounding_box=bounding_box,
-                    raw_text=raw_text,
-                )
-            except ValueError:
-                continue
         
-        # If all formats fail, try extracting date components
-        date_match = re.search(r"(\d{1,2})[/\-.](\d{1,2})[/\-.](\d{2,4})", cleaned)
-        if date_match:
-            try:
-                d, m, y = date_match.groups()
-                year = int(y)
-                if year < 100:
-                    year += 2000
-                
-                # Try both day/month orders
-                try:
-                    parsed_date = date(year, int(m), int(d))
-                except ValueError:
-                    parsed_date = date(year, int(d), int(m))
-                
-                return ExtractedField(
-                    value=parsed_date,
-                    confidence=confidence * 0.8,  # Lower confidence for fallback
-                    bounding_box=bounding_box,
-                    raw_text=raw_text,
-                )
-            except ValueError:
-                pass
+        parsed = _date_core(text)
+        if parsed is not None:
+            value, factor = parsed
+            return ExtractedField(
+                value=value,
+                confidence=confidence * factor,
+                bounding_box=bounding_box,
+                raw_text=raw_text,
+            )
         
         # Could not parse - return today as fallback with low confidence
         logger.warning(f"Failed to parse date '{text}', using today")
@@ -272,31 +482,12 @@ class FieldNormalizer:
             ExtractedField with Decimal value
         """
         raw_text = text
-        cleaned = text.strip()
+        value, parse_error = _quantity_core(text)
         
-        # Fix OCR errors
-        cleaned = self._fix_ocr_errors(cleaned)
-        
-        # Extract numeric portion (ignore trailing units like "pcs", "units")
-        match = re.match(r"[\d,]+\.?\d*", cleaned)
-        if match:
-            cleaned = match.group(0)
-        
-        # Remove thousands separators
-        cleaned = cleaned.replace(",", "")
-        
-        try:
-            value = Decimal(cleaned)
-            
-            # Validate reasonable range for quantity
-            if value < 0:
-                value = abs(value)  # Assume positive
-            if value > Decimal("1000000"):
-                logger.warning(f"Unusually large quantity: {value}")
-                
-        except (InvalidOperation, ValueError) as e:
-            logger.warning(f"Failed to parse quantity '{text}': {e}")
-            value = Decimal("0")
+        if parse_error is not None:
+            logger.warning(f"Failed to parse quantity '{text}': {parse_error}")
+        elif value > MAX_QUANTITY:
+            logger.warning(f"Unusually large quantity: {value}")
         
         return ExtractedField(
             value=value,
@@ -325,12 +516,7 @@ class FieldNormalizer:
             ExtractedField with cleaned string
         """
         raw_text = text
-        
-        # Remove control characters
-        cleaned = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", text)
-        
-        # Normalize whitespace
-        cleaned = " ".join(cleaned.split())
+        cleaned = _string_core(text)
         
         return ExtractedField(
             value=cleaned,
@@ -339,31 +525,6 @@ class FieldNormalizer:
             raw_text=raw_text,
         )
     
-    def _fix_ocr_errors(self, text: str) -> str:
-        """
-        Fix common OCR character recognition errors.
-        
-        Only applies fixes in numeric contexts to avoid
-        corrupting actual text.
-        """
-        result = text
-        
-        # Look for numeric patterns and fix errors within them
-        def fix_numeric_section(match: re.Match) -> str:
-            section = match.group(0)
-            for wrong, right in OCR_CHAR_FIXES.items():
-                section = section.replace(wrong, right)
-            return section
-        
-        # Match sections that look numeric (digits, decimals, commas plus OCR errors)
-        result = re.sub(
-            r"[\dSsOolIBZgG,.\-]+",
-            fix_numeric_section,
-            result
-        )
-        
-        return result
-    
     def blocks_to_field_amount(
         self,
         blocks: list[TextBlock],
@@ -371,26 +532,13 @@ class FieldNormalizer:
         """Convert a list of text blocks into a monetary amount field."""
         if not blocks:
             return ExtractedField(
-                value=Decimal("0"),
+                value=ZERO,
                 confidence=0.0,
                 bounding_box=None,
                 raw_text="",
             )
         
-        # Combine text from all blocks
-        combined_text = " ".join(b.text for b in blocks)
-        avg_confidence = sum(b.confidence for b in blocks) / len(blocks)
-        
-        # Use first block's bounding box
-        first = blocks[0]
-        bbox = BoundingBox(
-            x_min=first.x_min,
-            y_min=first.y_min,
-            x_max=first.x_max,
-            y_max=first.y_max,
-            page=first.page,
-        )
-        
+        combined_text, avg_confidence, bbox = self._combine_blocks(blocks)
         return self.normalize_amount(combined_text, avg_confidence, bbox)
     
     def blocks_to_field_date(
@@ -406,8 +554,24 @@ class FieldNormalizer:
                 raw_text="",
             )
         
-        combined_text = " ".join(b.text for b in blocks)
-        avg_confidence = sum(b.confidence for b in blocks) / len(blocks)
+        combined_text, avg_confidence, bbox = self._combine_blocks(blocks)
+        return self.normalize_date(combined_text, avg_confidence, bbox)
+    
+    def _combine_blocks(
+        self,
+        blocks: list[TextBlock],
+    ) -> tuple[str, float, BoundingBox]:
+        """
+        Join block texts and average their confidence in one pass.
+        
+        The bounding box is the first block's. Confidences go through
+        sum(), which rounds the same way the generator version did.
+        """
+        texts: list[str] = []
+        confidences: list[float] = []
+        for block in blocks:
+            texts.append(block.text)
+            confidences.append(block.confidence)
         
         first = blocks[0]
         bbox = BoundingBox(
@@ -417,5 +581,4 @@ class FieldNormalizer:
             y_max=first.y_max,
             page=first.page,
         )
-        
-        return self.normalize_date(combined_text, avg_confidence, bbox)
+        return " ".join(texts), sum(confidences) / len(confidences), bbox
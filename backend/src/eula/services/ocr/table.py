@@ -13,8 +13,10 @@ Design Decisions:
 """
 
 import logging
-from collections import defaultdict
+import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from itertools import accumulate
 from typing import Any
 
 from .engine import OCRResult, TextBlock
@@ -32,7 +34,7 @@ COLUMN_TOLERANCE = 0.05
 MIN_TABLE_ROWS = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCell:
     """A single cell in a detected table."""
     text: str
@@ -49,27 +51,29 @@ class TableCell:
         return min(b.confidence for b in self.blocks)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRow:
     """A row of cells in a detected table."""
     index: int
-    cells: dict[int, TableCell] = field(default_factory=dict)
+    cells: list[TableCell | None] = field(default_factory=list)  # One slot per column
     
     def get_cell(self, column: int) -> TableCell | None:
         """Get cell at specified column index."""
-        return self.cells.get(column)
+        if 0 <= column < len(self.cells):
+            return self.cells[column]
+        return None
     
     def as_dict(self, column_names: dict[int, str]) -> dict[str, Any]:
         """Convert row to dictionary using column names as keys."""
         result = {}
         for col_idx, name in column_names.items():
-            cell = self.cells.get(col_idx)
+            cell = self.get_cell(col_idx)
             if cell:
                 result[name] = cell.text
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectedTable:
     """A table detected in the document."""
     page: int
@@ -153,6 +157,15 @@ class TableDetector:
         self.row_tolerance = row_tolerance
         self.column_tolerance = column_tolerance
         self.min_rows = min_rows
+        
+        # One lookahead per position reports the first canonical column
+        # whose pattern starts there; the earliest column in
+        # COLUMN_PATTERNS still wins across positions
+        self._header_priority = {name: i for i, name in enumerate(self.COLUMN_PATTERNS)}
+        self._header_pattern = re.compile("(?=" + "|".join(
+            f"(?P<{name}>" + "|".join(re.escape(p) for p in patterns) + ")"
+            for name, patterns in self.COLUMN_PATTERNS.items()
+        ) + ")")
     
     def detect_tables(self, ocr_result: OCRResult) -> list[DetectedTable]:
         """
@@ -199,11 +212,18 @@ class TableDetector:
         # Detect header row and extract column names
         column_names = self._detect_header(table_rows[0], column_positions)
         
-        # Calculate table bounds
-        x_min = min(b.x_min for b in blocks)
-        y_min = min(b.y_min for b in blocks)
-        x_max = max(b.x_max for b in blocks)
-        y_max = max(b.y_max for b in blocks)
+        # Calculate table bounds in one pass over the blocks
+        first = blocks[0]
+        x_min, y_min, x_max, y_max = first.x_min, first.y_min, first.x_max, first.y_max
+        for b in blocks:
+            if b.x_min < x_min:
+                x_min = b.x_min
+            if b.y_min < y_min:
+                y_min = b.y_min
+            if b.x_max > x_max:
+                x_max = b.x_max
+            if b.y_max > y_max:
+                y_max = b.y_max
         
         table = DetectedTable(
             page=page,
@@ -226,20 +246,22 @@ class TableDetector:
         if not blocks:
             return []
         
-        # Sort by vertical position
-        sorted_blocks = sorted(blocks, key=lambda b: b.center_y)
+        # Sort by vertical position, reading each block's center once.
+        # Ties on (y, index) keep document order, as a stable sort would.
+        keyed = sorted((block.center_y, i) for i, block in enumerate(blocks))
+        tolerance = self.row_tolerance
         
         rows: list[list[TextBlock]] = []
-        current_row: list[TextBlock] = [sorted_blocks[0]]
-        current_y = sorted_blocks[0].center_y
+        current_y, first = keyed[0]
+        current_row: list[TextBlock] = [blocks[first]]
         
-        for block in sorted_blocks[1:]:
-            if abs(block.center_y - current_y) <= self.row_tolerance:
-                current_row.append(block)
+        for y, i in keyed[1:]:
+            if abs(y - current_y) <= tolerance:
+                current_row.append(blocks[i])
             else:
                 rows.append(current_row)
-                current_row = [block]
-                current_y = block.center_y
+                current_row = [blocks[i]]
+                current_y = y
         
         if current_row:
             rows.append(current_row)
@@ -263,8 +285,8 @@ class TableDetector:
             return []
         
         # Collect all left edges
-        left_edges = [b.x_min for b in blocks]
-        left_edges.sort()
+        left_edges = sorted(b.x_min for b in blocks)
+        tolerance = self.column_tolerance
         
         # Cluster left edges to find column starts
         column_starts: list[float] = []
@@ -273,14 +295,14 @@ class TableDetector:
         cluster_count = 1
         
         for edge in left_edges[1:]:
-            if edge - cluster_start <= self.column_tolerance:
+            if edge - cluster_start <= tolerance:
                 cluster_sum += edge
                 cluster_count += 1
             else:
                 # Found a new column
                 if column_starts:
                     # The boundary is between previous cluster and this one
-                    boundary = (column_starts[-1] + cluster_start) / 2 + self.column_tolerance
+                    boundary = (column_starts[-1] + cluster_start) / 2 + tolerance
                     if boundary > column_starts[-1]:
                         column_starts.append(boundary)
                 column_starts.append(cluster_sum / cluster_count)
@@ -289,16 +311,13 @@ class TableDetector:
                 cluster_count = 1
         
         # Handle last cluster
-        if column_starts:
-            column_starts.append(cluster_sum / cluster_count)
-        else:
-            column_starts.append(cluster_sum / cluster_count)
+        column_starts.append(cluster_sum / cluster_count)
         
         # Convert column starts to boundaries between columns
-        boundaries: list[float] = []
-        for i in range(len(column_starts) - 1):
-            boundary = (column_starts[i] + column_starts[i + 1]) / 2
-            boundaries.append(boundary)
+        boundaries = [
+            (left + right) / 2
+            for left, right in zip(column_starts, column_starts[1:])
+        ]
         
         return boundaries
     
@@ -310,16 +329,21 @@ class TableDetector:
         """Convert grouped text blocks into structured table rows."""
         table_rows: list[TableRow] = []
         
+        # Boundaries can dip when two clusters sit close together; their
+        # running maximum is sorted and has the same first boundary past x
+        ceilings = list(accumulate(column_positions, max))
+        num_columns = len(column_positions) + 1
+        
         for row_idx, blocks in enumerate(text_rows):
-            cells: dict[int, TableCell] = {}
+            cells: list[TableCell | None] = [None] * num_columns
             
             for block in blocks:
-                col_idx = self._get_column_index(block.center_x, column_positions)
+                col_idx = self._get_column_index(block.center_x, ceilings)
+                cell = cells[col_idx]
                 
-                if col_idx in cells:
-                    # Append to existing cell
-                    cells[col_idx].text += " " + block.text
-                    cells[col_idx].blocks.append(block)
+                if cell is not None:
+                    # Append to existing cell; text is joined below
+                    cell.blocks.append(block)
                 else:
                     # Create new cell
                     cells[col_idx] = TableCell(
@@ -330,6 +354,10 @@ class TableDetector:
                         blocks=[block],
                     )
             
+            for cell in cells:
+                if cell is not None and len(cell.blocks) > 1:
+                    cell.text = " ".join(b.text for b in cell.blocks)
+            
             table_rows.append(TableRow(index=row_idx, cells=cells))
         
         return table_rows
@@ -339,11 +367,11 @@ class TableDetector:
         x_position: float,
         boundaries: list[float],
     ) -> int:
-        """Determine which column a position belongs to."""
-        for i, boundary in enumerate(boundaries):
-            if x_position < boundary:
-                return i
-        return len(boundaries)
+        """Determine which column a position belongs to.
+        
+        Boundaries must be sorted ascending.
+        """
+        return bisect_right(boundaries, x_position)
     
     def _detect_header(
         self,
@@ -356,18 +384,24 @@ class TableDetector:
         Returns mapping of column index to normalized column name.
         """
         column_names: dict[int, str] = {}
+        priority = self._header_priority
         
-        for col_idx, cell in first_row.cells.items():
+        for col_idx, cell in enumerate(first_row.cells):
+            if cell is None:
+                continue
             text = cell.text.lower().strip()
             
             # Check against known patterns
-            for canonical_name, patterns in self.COLUMN_PATTERNS.items():
-                if any(p in text for p in patterns):
-                    column_names[col_idx] = canonical_name
-                    break
-            else:
-                # Use original text if no pattern matches
-                column_names[col_idx] = text
+            best: str | None = None
+            for match in self._header_pattern.finditer(text):
+                name = match.lastgroup
+                if best is None or priority[name] < priority[best]:
+                    best = name
+                    if priority[best] == 0:
+                        break
+            
+            # Use original text if no pattern matches
+            column_names[col_idx] = best if best is not None else text
         
         return column_names
     
@@ -7,24 +7,39 @@ https://xrpl.org/docs/tutorials/python/nfts/mint-and-burn-nfts
 Handles:
 - NFTokenMint transaction creation and submission
 - Account NFT queries
-- Synchronous client for reliability
+- Synchronous client for reliability, async client for batch minting
 """
 
+import asyncio
+import binascii
+import hashlib
 import json
 import logging
 import ssl
-from dataclasses import dataclass
+import threading
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
 from enum import Enum
 from typing import Any
 
+import httpx
 import xrpl
+from xrpl.asyncio.account import get_next_valid_seq_number
+from xrpl.asyncio.clients import AsyncJsonRpcClient, XRPLRequestFailureException
+from xrpl.asyncio.clients.utils import json_to_response, request_to_json_rpc
+from xrpl.asyncio.ledger import get_fee, get_latest_validated_ledger_sequence
+from xrpl.asyncio.transaction import submit as submit_async
+from xrpl.asyncio.transaction import submit_and_wait as submit_and_wait_async
 from xrpl.clients import JsonRpcClient
-from xrpl.models import NFTokenMint, AccountNFTs
-from xrpl.transaction import sign_and_submit
+from xrpl.models import NFTokenMint, AccountNFTs, Request, Response, Tx
+from xrpl.transaction import sign, submit_and_wait
 from xrpl.wallet import Wallet
 
+from eula.infrastructure.duplicate_index import DuplicateIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,14 +57,80 @@ NETWORK_URLS = {
     XRPLNetwork.DEVNET: "https://s.devnet.rippletest.net:51234",
 }
 
+# Shared read-only default for missing metadata sections; never mutated
+_EMPTY: dict[str, Any] = {}
 
-@dataclass
+# Wallets derived for recent seeds, oldest first
+WALLET_CACHE_SIZE = 128
+_wallet_cache: dict[str, Wallet] = {}
+_wallet_cache_lock = threading.Lock()
+
+
+def _wallet_from_seed(seed: str) -> Wallet:
+    """
+    Derive the wallet for a seed, reusing it for repeated mints.
+    
+    Key derivation is elliptic-curve math and dominates the CPU cost of a
+    mint. Entries are keyed by a digest of the seed rather than the seed
+    itself, but the cached Wallet still holds the private key in memory
+    for the life of the process; call clear_wallet_cache() to drop them.
+    """
+    key = hashlib.blake2b(seed.encode("utf-8"), digest_size=16).hexdigest()
+    with _wallet_cache_lock:
+        wallet = _wallet_cache.get(key)
+        if wallet is not None:
+            return wallet
+    
+    wallet = Wallet.from_seed(seed)
+    with _wallet_cache_lock:
+        if len(_wallet_cache) >= WALLET_CACHE_SIZE:
+            # Evict the oldest entry
+            del _wallet_cache[next(iter(_wallet_cache))]
+        _wallet_cache[key] = wallet
+    return wallet
+
+
+def clear_wallet_cache() -> None:
+    """Forget every cached wallet (and with it the private keys)."""
+    with _wallet_cache_lock:
+        _wallet_cache.clear()
+
+
+# EULA_v1 metadata as json.dumps lays it out, with the fields spliced in
+_METADATA_TEMPLATE = (
+    '{{"schema": "EULA_v1", '
+    '"name": "Verified Invoice: #{invoice_number}", '
+    '"description": "3-Way Matched Supply Chain Asset", '
+    '"properties": {{'
+    '"issuer_did": "{issuer_did}", '
+    '"face_value": "{face_value}", '
+    '"currency": "{currency}", '
+    '"due_date": "{due_date}", '
+    '"audit_status": "PASSED_AI_VERIFICATION", '
+    '"document_hashes": {{'
+    '"invoice_hash": "{invoice_hash}", '
+    '"po_hash": "{po_hash}", '
+    '"pod_hash": "{pod_hash}"'
+    '}}}}}}'
+)
+
+
+def _json_text(value: str) -> str:
+    """Body of a JSON string literal for value, escaped as json.dumps would."""
+    # Printable ASCII other than quote and backslash is emitted verbatim
+    if value.isascii() and value.isprintable() and '"' not in value and "\\" not in value:
+        return value
+    return json.dumps(value)[1:-1]
+
+
+@dataclass(frozen=True, slots=True)
 class NFTMetadata:
     """
     NFT metadata following EULA schema.
     
     This structure is stored in the NFT URI and provides
-    tamper-evident document verification.
+    tamper-evident document verification. Instances are immutable, so the
+    encoded URI is computed once and reused across retries.
     """
     invoice_number: str
     face_value: Decimal
@@ -59,30 +140,54 @@ class NFTMetadata:
     invoice_hash: str
     po_hash: str
     pod_hash: str
+    _hex_uri: str | None = field(default=None, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def from_minor_units(
+        cls,
+        face_value_minor: int,
+        currency_exponent: int = 2,
+        **fields: Any,
+    ) -> "NFTMetadata":
+        """
+        Build metadata from an integer amount in minor units (e.g. cents).
+        
+        The face value is rescaled exactly, so 800000 with exponent 2 is
+        written to the URI as "8000.00".
+        """
+        return cls(face_value=Decimal(face_value_minor).scaleb(-currency_exponent), **fields)
     
     def to_json(self) -> str:
-        """Serialize to JSON for NFT URI."""
-        return json.dumps({
-            "schema": "EULA_v1",
-            "name": f"Verified Invoice: #{self.invoice_number}",
-            "description": "3-Way Matched Supply Chain Asset",
-            "properties": {
-                "issuer_did": self.issuer_did,
-                "face_value": str(self.face_value),
-                "currency": self.currency,
-                "due_date": self.due_date.isoformat(),
-                "audit_status": "PASSED_AI_VERIFICATION",
-                "document_hashes": {
-                    "invoice_hash": self.invoice_hash,
-                    "po_hash": self.po_hash,
-                    "pod_hash": self.pod_hash,
-                },
-            },
-        })
+        """
+        Serialize to JSON for NFT URI.
+        
+        The bytes end up on the ledger as the NFT URI, so the layout
+        (stdlib separators, key order, ASCII escaping) is part of the
+        EULA_v1 schema and must not change with the installed packages.
+        """
+        return _METADATA_TEMPLATE.format(
+            invoice_number=_json_text(self.invoice_number),
+            issuer_did=_json_text(self.issuer_did),
+            # str(Decimal) is always plain ASCII, so it needs no escaping
+            face_value=str(self.face_value),
+            currency=_json_text(self.currency),
+            due_date=self.due_date.isoformat(),
+            invoice_hash=_json_text(self.invoice_hash),
+            po_hash=_json_text(self.po_hash),
+            pod_hash=_json_text(self.pod_hash),
+        )
+    
+    @property
+    def hex_uri(self) -> str:
+        """Hex-encoded URI for XRPL."""
+        if self._hex_uri is None:
+            hex_uri = binascii.b2a_hex(self.to_json().encode('utf-8')).upper().decode('ascii')
+            object.__setattr__(self, "_hex_uri", hex_uri)
+        return self._hex_uri
     
     def to_hex(self) -> str:
-        """Convert to hex-encoded URI for XRPL."""
-        return self.to_json().encode('utf-8').hex().upper()
+        """Convert to hex-encoded URI for XRPL (same as hex_uri)."""
+        return self.hex_uri
 
 
 @dataclass
@@ -103,6 +208,42 @@ class DuplicateCheckResult:
     message: str = ""
 
 
+class _PooledJsonRpcClient(JsonRpcClient):
+    """
+    JsonRpcClient that sends every request over one keep-alive session.
+    
+    xrpl-py opens a fresh httpx client (and TLS handshake) per request;
+    this routes requests through a shared httpx.Client instead. It
+    overrides JsonRpcBase._request_impl, which is private, so the
+    supported xrpl-py range is pinned in pyproject.toml.
+    """
+    
+    def __init__(self, url: str, http: httpx.Client) -> None:
+        super().__init__(url)
+        self._http = http
+    
+    async def _request_impl(self, request: Request, *, timeout: float | None = None) -> Response:
+        # Runs inside the short-lived loop of xrpl's sync wrappers, so the
+        # blocking call only ever holds up this request
+        response = self._http.post(
+            self.url,
+            json=request_to_json_rpc(request),
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+        )
+        try:
+            body = response.json()
+        except json.JSONDecodeError:
+            body = None
+        
+        # As upstream, a body that is not a JSON-RPC response (e.g. a proxy's
+        # error page) raises rather than being parsed
+        if not isinstance(body, dict) or "result" not in body:
+            raise XRPLRequestFailureException(
+                {"error": response.status_code, "error_message": response.text}
+            )
+        return json_to_response(body)
+
+
 class XRPLService:
     """
     Service for XRPL NFT operations following official tutorial pattern.
@@ -111,19 +252,18 @@ class XRPLService:
     https://xrpl.org/docs/tutorials/python/nfts/mint-and-burn-nfts
     
     Example:
-        service = XRPLService(network=XRPLNetwork.TESTNET)
-        
-        # Mint NFT with wallet seed
-        result = service.mint_nft(
-            seed="sEdVW...",
-            uri="ipfs://...",
-            flags=8,
-            transfer_fee=500,
-            taxon=1
-        )
-        
-        if result.success:
-            print(f"Minted NFT: {result.nft_id}")
+        with XRPLService(network=XRPLNetwork.TESTNET) as service:
+            # Mint NFT with wallet seed
+            result = service.mint_nft(
+                seed="sEdVW...",
+                uri="ipfs://...",
+                flags=8,
+                transfer_fee=500,
+                taxon=1
+            )
+            
+            if result.success:
+                print(f"Minted NFT: {result.nft_id}")
     """
     
     # NFT flags
@@ -135,10 +275,28 @@ class XRPLService:
     # Taxon for EULA invoice NFTs
     INVOICE_TAXON = 1
     
+    # NFTs per account_nfts page (the largest limit rippled accepts)
+    ACCOUNT_NFTS_PAGE_SIZE = 400
+    
+    # Ledgers a prepared batch transaction stays valid for
+    LEDGER_SEQUENCE_OFFSET = 20
+    
+    # In-flight requests for batch mints (keeps under rippled rate limits)
+    MAX_CONCURRENT_MINTS = 16
+    
+    # Seconds between checks for a batch mint reaching a validated ledger
+    VALIDATION_POLL_INTERVAL = 1.0
+    
+    # Keep-alive pool for the sync client
+    HTTP_KEEPALIVE_CONNECTIONS = 16
+    HTTP_KEEPALIVE_EXPIRY = 60.0
+    HTTP_TIMEOUT = 10.0
+    
     def __init__(
         self,
         network: XRPLNetwork = XRPLNetwork.TESTNET,
         custom_url: str | None = None,
+        duplicate_index: DuplicateIndex | None = None,
     ) -> None:
         """
         Initialize XRPL service.
@@ -146,17 +304,48 @@ class XRPLService:
         Args:
             network: XRPL network to connect to
             custom_url: Override network URL (for testing)
+            duplicate_index: Off-chain index of minted invoice hashes
+                (without one, duplicate checks always pass)
         """
         self.network = network
         self.url = custom_url or NETWORK_URLS[network]
+        self.duplicate_index = duplicate_index
+        self._http: httpx.Client | None = None
         self._client: JsonRpcClient | None = None
+        self._async_client: AsyncJsonRpcClient | None = None
+    
+    def __enter__(self) -> "XRPLService":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections held by the sync client."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+            self._client = None
     
     def _get_client(self) -> JsonRpcClient:
         """Get or create JSON-RPC client."""
         if self._client is None:
-            self._client = JsonRpcClient(self.url)
+            self._http = httpx.Client(
+                timeout=self.HTTP_TIMEOUT,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.HTTP_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=self.HTTP_KEEPALIVE_EXPIRY,
+                ),
+            )
+            self._client = _PooledJsonRpcClient(self.url, self._http)
         return self._client
     
+    def _get_async_client(self) -> AsyncJsonRpcClient:
+        """Get or create async JSON-RPC client."""
+        if self._async_client is None:
+            self._async_client = AsyncJsonRpcClient(self.url)
+        return self._async_client
+    
     def mint_nft(
         self,
         seed: str,
@@ -171,7 +360,7 @@ class XRPLService:
         This follows the official XRPL Python tutorial pattern:
         1. Create wallet from seed
         2. Build NFTokenMint transaction
-        3. Sign and submit
+        3. Sign, submit and wait for a validated ledger
         4. Extract NFT ID from metadata
         
         Args:
@@ -186,49 +375,48 @@ class XRPLService:
         """
         try:
             # Create wallet from seed
-            wallet = Wallet.from_seed(seed)
+            wallet = _wallet_from_seed(seed)
             logger.info(f"Minting NFT for account: {wallet.classic_address}")
             
-            # Hex-encode URI if not already
-            if not uri.startswith(('ipfs://', 'http')):
-                uri_hex = uri  # Already hex
-            else:
-                uri_hex = uri.encode('utf-8').hex().upper()
+            mint_tx = self._build_mint_tx(wallet, uri, flags, transfer_fee, taxon)
+            
+            # Sign, submit and wait: only the validated result carries meta
+            client = self._get_client()
+            response = submit_and_wait(mint_tx, client, wallet)
             
-            # Build NFTokenMint transaction
-            mint_tx = NFTokenMint(
-                account=wallet.classic_address,
-                uri=uri_hex,
-                flags=flags,
-                transfer_fee=transfer_fee,
-                nftoken_taxon=taxon,
+            return self._mint_result(response.result)
+                
+        except Exception as e:
+            logger.exception("NFT minting failed")
+            return MintResult(
+                success=False,
+                error=str(e),
             )
+    
+    async def mint_nft_async(
+        self,
+        seed: str,
+        uri: str,
+        flags: int = FLAG_TRANSFERABLE,
+        transfer_fee: int = DEFAULT_TRANSFER_FEE,
+        taxon: int = INVOICE_TAXON,
+    ) -> MintResult:
+        """
+        Mint an NFT on the XRPL without blocking the event loop.
+        
+        Same steps and arguments as mint_nft, submitted through the
+        async JSON-RPC client (safe to await from FastAPI handlers).
+        """
+        try:
+            wallet = _wallet_from_seed(seed)
+            logger.info(f"Minting NFT for account: {wallet.classic_address}")
             
-            # Sign and submit
-            client = self._get_client()
-            response = sign_and_submit(mint_tx, client, wallet)
+            mint_tx = self._build_mint_tx(wallet, uri, flags, transfer_fee, taxon)
             
-            # Check result
-            result = response.result
+            client = self._get_async_client()
+            response = await submit_and_wait_async(mint_tx, client, wallet)
             
-            if result.get("meta", {}).get("TransactionResult") == "tesSUCCESS":
-                # Extract NFT ID from affected nodes
-                nft_id = self._extract_nft_id(result)
-                tx_hash = result.get("hash")
-                
-                logger.info(f"NFT minted successfully: {nft_id}")
-                return MintResult(
-                    success=True,
-                    nft_id=nft_id,
-                    tx_hash=tx_hash,
-                )
-            else:
-                error = result.get("meta", {}).get("TransactionResult", "Unknown error")
-                logger.error(f"NFT mint failed: {error}")
-                return MintResult(
-                    success=False,
-                    error=error,
-                )
+            return self._mint_result(response.result)
                 
         except Exception as e:
             logger.exception("NFT minting failed")
@@ -237,6 +425,248 @@ class XRPLService:
                 error=str(e),
             )
     
+    async def mint_invoice_nfts_batch(
+        self,
+        items: Iterable[tuple[str, NFTMetadata]],
+        max_concurrency: int = MAX_CONCURRENT_MINTS,
+    ) -> list[MintResult]:
+        """
+        Mint many invoice NFTs, overlapping the ledger round-trips.
+        
+        Items are grouped by seed and each account's mints are prepared
+        together (see mint_invoice_nfts_for_seed); submissions for all
+        accounts share one cap of max_concurrency in flight.
+        
+        Args:
+            items: (seed, metadata) pairs
+            max_concurrency: Cap on simultaneous submissions
+            
+        Returns:
+            One MintResult per item, in input order
+        """
+        items = list(items)
+        results: list[MintResult | None] = [None] * len(items)
+        
+        by_seed: dict[str, list[int]] = defaultdict(list)
+        for index, (seed, _) in enumerate(items):
+            by_seed[seed].append(index)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def mint_account(seed: str, indices: list[int]) -> None:
+            metadatas = [items[index][1] for index in indices]
+            account_results = await self._mint_account_batch(seed, metadatas, semaphore)
+            for index, result in zip(indices, account_results):
+                results[index] = result
+        
+        await asyncio.gather(*(mint_account(seed, indices) for seed, indices in by_seed.items()))
+        return results
+    
+    async def mint_invoice_nfts_for_seed(
+        self,
+        seed: str,
+        metadatas: Iterable[NFTMetadata],
+        max_concurrency: int = MAX_CONCURRENT_MINTS,
+    ) -> list[MintResult]:
+        """
+        Mint several invoice NFTs from one account.
+        
+        mint_nft autofills every transaction, costing extra round
+        trips for the sequence number, fee and ledger index each time.
+        Here they are fetched once: the transactions take consecutive
+        sequence numbers and are signed locally. They are submitted in
+        sequence order, then all awaited together until they reach a
+        validated ledger, so each result reflects the final outcome.
+        
+        Args:
+            seed: Wallet seed of the issuing account
+            metadatas: NFT metadata for each invoice
+            max_concurrency: Cap on simultaneous submissions
+            
+        Returns:
+            One MintResult per metadata, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return await self._mint_account_batch(seed, list(metadatas), semaphore)
+    
+    async def _mint_account_batch(
+        self,
+        seed: str,
+        metadatas: list[NFTMetadata],
+        semaphore: asyncio.Semaphore,
+    ) -> list[MintResult]:
+        """Prepare once, then sign and submit one account's invoice mints."""
+        if not metadatas:
+            return []
+        
+        client = self._get_async_client()
+        try:
+            wallet = _wallet_from_seed(seed)
+            logger.info(f"Minting {len(metadatas)} NFTs for account: {wallet.classic_address}")
+            
+            sequence = await get_next_valid_seq_number(wallet.classic_address, client)
+            fee = await get_fee(client)
+            last_ledger = (
+                await get_latest_validated_ledger_sequence(client) + self.LEDGER_SEQUENCE_OFFSET
+            )
+            
+            signed_txs = [
+                sign(
+                    self._build_mint_tx(
+                        wallet,
+                        metadata.hex_uri,
+                        self.FLAG_TRANSFERABLE,
+                        self.DEFAULT_TRANSFER_FEE,
+                        self.INVOICE_TAXON,
+                        sequence=sequence + offset,
+                        fee=fee,
+                        last_ledger_sequence=last_ledger,
+                    ),
+                    wallet,
+                )
+                for offset, metadata in enumerate(metadatas)
+            ]
+        except Exception as e:
+            logger.exception("NFT batch preparation failed")
+            return [MintResult(success=False, error=str(e)) for _ in metadatas]
+        
+        # Submitted one at a time: a mint that reaches rippled ahead of its
+        # predecessor is rejected with terPRE_SEQ rather than held
+        submitted: list[NFTokenMint] = []
+        for signed_tx in signed_txs:
+            try:
+                async with semaphore:
+                    response = await submit_async(signed_tx, client)
+                engine_result = response.result.get("engine_result", "Unknown error")
+            except Exception as e:
+                logger.exception("NFT submission failed")
+                engine_result = str(e)
+            # tec results still consume the sequence number (the failure
+            # shows up in the validated meta), so later mints can proceed
+            if engine_result.startswith(("tes", "tec")) or engine_result == "terQUEUED":
+                submitted.append(signed_tx)
+                continue
+            logger.error(f"NFT submission rejected: {engine_result}")
+            break
+        
+        async def confirm(signed_tx: NFTokenMint) -> MintResult:
+            try:
+                result = await self._wait_for_validation(
+                    client, signed_tx.get_hash(), last_ledger, semaphore
+                )
+                return self._mint_result(result)
+            except Exception as e:
+                logger.exception("NFT minting failed")
+                return MintResult(success=False, error=str(e))
+        
+        # confirm reports failures in its MintResult, so one bad mint never
+        # cancels the rest of the batch
+        results = list(await asyncio.gather(*(confirm(tx) for tx in submitted)))
+        
+        # Mints after a rejected one are never submitted: their sequence
+        # numbers would wait on it until they expired
+        if len(submitted) < len(signed_txs):
+            results.append(MintResult(success=False, error=engine_result))
+            rejected = sequence + len(submitted)
+            results.extend(
+                MintResult(success=False, error=f"Not submitted: sequence {rejected} was rejected")
+                for _ in signed_txs[len(submitted) + 1:]
+            )
+        
+        for metadata, result in zip(metadatas, results):
+            self._record_mint(metadata, result)
+        return results
+    
+    async def _wait_for_validation(
+        self,
+        client: AsyncJsonRpcClient,
+        tx_hash: str,
+        last_ledger_sequence: int,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, Any]:
+        """
+        Poll until a submitted transaction is in a validated ledger.
+        
+        Returns the validated transaction, including its meta. Raises
+        RuntimeError once validated ledgers reach last_ledger_sequence
+        without it (the transaction can no longer apply).
+        """
+        while True:
+            await asyncio.sleep(self.VALIDATION_POLL_INTERVAL)
+            async with semaphore:
+                # Read the ledger first: a transaction missing from a lookup
+                # made after that ledger closed is missing from it too
+                latest_ledger = await get_latest_validated_ledger_sequence(client)
+                response = await client.request(Tx(transaction=tx_hash))
+            
+            if response.is_successful():
+                if response.result.get("validated"):
+                    return response.result
+            elif response.result.get("error") != "txnNotFound":
+                raise RuntimeError(f"Failed to look up transaction {tx_hash}: {response.result}")
+            
+            if latest_ledger >= last_ledger_sequence:
+                raise RuntimeError(
+                    f"Transaction {tx_hash} expired: not validated by ledger "
+                    f"{last_ledger_sequence}"
+                )
+    
+    def _build_mint_tx(
+        self,
+        wallet: Wallet,
+        uri: str,
+        flags: int,
+        transfer_fee: int,
+        taxon: int,
+        sequence: int | None = None,
+        fee: str | None = None,
+        last_ledger_sequence: int | None = None,
+    ) -> NFTokenMint:
+        """
+        Build the NFTokenMint transaction for a wallet.
+        
+        Sequence, fee and last ledger are left for autofill unless given.
+        """
+        # Hex-encode URI if not already
+        if not uri.startswith(('ipfs://', 'http')):
+            uri_hex = uri  # Already hex
+        else:
+            uri_hex = uri.encode('utf-8').hex().upper()
+        
+        return NFTokenMint(
+            account=wallet.classic_address,
+            uri=uri_hex,
+            flags=flags,
+            transfer_fee=transfer_fee,
+            nftoken_taxon=taxon,
+            sequence=sequence,
+            fee=fee,
+            last_ledger_sequence=last_ledger_sequence,
+        )
+    
+    def _mint_result(self, result: dict[str, Any]) -> MintResult:
+        """Turn a validated mint's result into a MintResult."""
+        meta = result.get("meta") or _EMPTY
+        status = meta.get("TransactionResult", "Unknown error")
+        
+        if status == "tesSUCCESS":
+            # Extract NFT ID from affected nodes
+            nft_id = self._extract_nft_id(result)
+            tx_hash = result.get("hash")
+            
+            logger.info(f"NFT minted successfully: {nft_id}")
+            return MintResult(
+                success=True,
+                nft_id=nft_id,
+                tx_hash=tx_hash,
+            )
+        
+        logger.error(f"NFT mint failed: {status}")
+        return MintResult(
+            success=False,
+            error=status,
+        )
+    
     def mint_invoice_nft(
         self,
         seed: str,
@@ -252,34 +682,98 @@ class XRPLService:
         Returns:
             MintResult with NFT ID if successful
         """
-        return self.mint_nft(
+        result = self.mint_nft(
             seed=seed,
-            uri=metadata.to_hex(),
+            uri=metadata.hex_uri,
             flags=self.FLAG_TRANSFERABLE,
             transfer_fee=self.DEFAULT_TRANSFER_FEE,
             taxon=self.INVOICE_TAXON,
         )
+        self._record_mint(metadata, result)
+        return result
+    
+    def iter_account_nfts(self, account: str) -> Iterator[dict[str, Any]]:
+        """
+        Yield the NFTs owned by an account, one ledger page at a time.
+        
+        Only the current page is held in memory, and pages after the one
+        the caller stops in are never requested.
+        
+        Args:
+            account: XRPL wallet address (r...)
+            
+        Yields:
+            NFT objects from the ledger
+            
+        Raises:
+            RuntimeError: If rippled rejects a page request
+        """
+        client = self._get_client()
+        marker = None
+        
+        while True:
+            request = AccountNFTs(
+                account=account,
+                limit=self.ACCOUNT_NFTS_PAGE_SIZE,
+                marker=marker,
+            )
+            response = client.request(request)
+            
+            if not response.is_successful():
+                raise RuntimeError(f"Failed to get NFTs for {account}: {response.result}")
+            
+            yield from response.result.get("account_nfts", ())
+            marker = response.result.get("marker")
+            if marker is None:
+                return
     
     def get_account_nfts(self, account: str) -> list[dict[str, Any]]:
         """
         Get all NFTs owned by an account.
         
+        rippled returns NFTs a page at a time with a marker for the next
+        page; every page is fetched (see iter_account_nfts to stream them).
+        
         Args:
             account: XRPL wallet address (r...)
             
         Returns:
-            List of NFT objects from the ledger
+            List of NFT objects from the ledger, or an empty list on failure
         """
         try:
-            client = self._get_client()
-            request = AccountNFTs(account=account)
-            response = client.request(request)
-            
-            if response.is_successful():
-                return response.result.get("account_nfts", [])
-            
-            logger.warning(f"Failed to get NFTs for {account}: {response.result}")
+            return list(self.iter_account_nfts(account))
+        except Exception:
+            logger.exception(f"Failed to get NFTs for {account}")
             return []
+    
+    async def get_account_nfts_async(self, account: str) -> list[dict[str, Any]]:
+        """
+        Get all NFTs owned by an account without blocking the event loop.
+        
+        Same paging and result as get_account_nfts. Pages are fetched in
+        order: each request needs the marker returned by the previous one.
+        """
+        try:
+            client = self._get_async_client()
+            nfts: list[dict[str, Any]] = []
+            marker = None
+            
+            while True:
+                request = AccountNFTs(
+                    account=account,
+                    limit=self.ACCOUNT_NFTS_PAGE_SIZE,
+                    marker=marker,
+                )
+                response = await client.request(request)
+                
+                if not response.is_successful():
+                    logger.warning(f"Failed to get NFTs for {account}: {response.result}")
+                    return []
+                
+                nfts.extend(response.result.get("account_nfts", []))
+                marker = response.result.get("marker")
+                if marker is None:
+                    return nfts
             
         except Exception as e:
             logger.exception(f"Failed to get NFTs for {account}")
@@ -287,10 +781,10 @@ class XRPLService:
     
     def check_duplicate(self, invoice_hash: str) -> DuplicateCheckResult:
         """
-        Check if an invoice hash already exists on the ledger.
+        Check if an invoice hash has already been minted.
         
-        Note: This is a simplified check. Production systems should
-        maintain an off-chain index of NFT hashes for efficiency.
+        Looks the hash up in the off-chain duplicate index; scanning the
+        ledger for it would mean reading every NFT ever minted.
         
         Args:
             invoice_hash: SHA-256 hash of the invoice document
@@ -298,42 +792,75 @@ class XRPLService:
         Returns:
             DuplicateCheckResult indicating if hash exists
         """
-        # For MVP, we just log a warning about the limitation
-        # A full implementation would query an off-chain index
-        logger.warning(
-            "Duplicate check is limited. Production should use "
-            "an off-chain index of NFT hashes for efficient lookup."
-        )
+        if self.duplicate_index is None:
+            logger.warning(
+                "Duplicate check is limited. Configure a DuplicateIndex "
+                "for off-chain lookup of minted NFT hashes."
+            )
+            return DuplicateCheckResult(
+                is_duplicate=False,
+                message="Hash not found in local index (simplified check)",
+            )
         
+        existing = self.duplicate_index.lookup(invoice_hash)
+        if existing is None:
+            return DuplicateCheckResult(
+                is_duplicate=False,
+                message="Hash not found in duplicate index",
+            )
+        
+        nft_id, issuer = existing
         return DuplicateCheckResult(
-            is_duplicate=False,
-            message="Hash not found in local index (simplified check)",
+            is_duplicate=True,
+            existing_nft_id=nft_id,
+            existing_issuer=issuer,
+            message=f"Invoice already minted as NFT {nft_id}",
         )
     
+    def _record_mint(self, metadata: NFTMetadata, result: MintResult) -> None:
+        """Add a successfully minted invoice to the duplicate index."""
+        if result.success and self.duplicate_index is not None:
+            self.duplicate_index.add(metadata.invoice_hash, result.nft_id, metadata.issuer_did)
+    
     def _extract_nft_id(self, tx_result: dict[str, Any]) -> str | None:
         """Extract NFT ID from transaction metadata."""
         try:
-            affected_nodes = tx_result.get("meta", {}).get("AffectedNodes", [])
+            meta = tx_result.get("meta") or _EMPTY
+            
+            # rippled reports the minted token directly (1.11+)
+            nft_id = meta.get("nftoken_id")
+            if nft_id:
+                return nft_id
             
-            for node in affected_nodes:
-                # Look for created NFTokenPage
-                created = node.get("CreatedNode", {})
-                if created.get("LedgerEntryType") == "NFTokenPage":
-                    nftokens = created.get("NewFields", {}).get("NFTokens", [])
-                    if nftokens:
-                        return nftokens[-1].get("NFToken", {}).get("NFTokenID")
+            # Otherwise find the token that is in an NFTokenPage now but was
+            # in none before. A mint can split a page, so tokens are compared
+            # across all pages rather than taking the last entry of one.
+            previous_ids: set[str] = set()
+            final_ids: list[str] = []
+            
+            for node in meta.get("AffectedNodes", ()):
+                if "CreatedNode" in node:
+                    page = node["CreatedNode"]
+                    if page.get("LedgerEntryType") != "NFTokenPage":
+                        continue
+                    final_tokens = page.get("NewFields", _EMPTY).get("NFTokens", ())
+                elif "ModifiedNode" in node:
+                    page = node["ModifiedNode"]
+                    if page.get("LedgerEntryType") != "NFTokenPage":
+                        continue
+                    # Pages whose token list did not change carry no NFTokens
+                    # in PreviousFields and cannot hold the new token
+                    previous_tokens = page.get("PreviousFields", _EMPTY).get("NFTokens")
+                    if not previous_tokens:
+                        continue
+                    previous_ids.update(t["NFToken"]["NFTokenID"] for t in previous_tokens)
+                    final_tokens = page.get("FinalFields", _EMPTY).get("NFTokens", ())
+                else:
+                    continue
                 
-                # Look for modified NFTokenPage
-                modified = node.get("ModifiedNode", {})
-                if modified.get("LedgerEntryType") == "NFTokenPage":
-                    final_nftokens = modified.get("FinalFields", {}).get("NFTokens", [])
-                    prev_nftokens = modified.get("PreviousFields", {}).get("NFTokens", [])
-                    
-                    # Find the new token (in final but not in previous)
-                    if len(final_nftokens) > len(prev_nftokens):
-                        return final_nftokens[-1].get("NFToken", {}).get("NFTokenID")
+                final_ids.extend(t["NFToken"]["NFTokenID"] for t in final_tokens)
             
-            return None
+            return next((i for i in final_ids if i not in previous_ids), None)
             
         except Exception as e:
             logger.warning(f"Could not extract NFT ID: {e}")
@@ -359,7 +886,7 @@ class XRPLService:
         return {
             "TransactionType": "NFTokenMint",
             "Account": account,
-            "URI": metadata.to_hex(),
+            "URI": metadata.hex_uri,
             "Flags": self.FLAG_TRANSFERABLE,
             "TransferFee": self.DEFAULT_TRANSFER_FEE,
             "NFTokenTaxon": self.INVOICE_TAXON,
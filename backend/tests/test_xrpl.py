@@ -0,0 +1,216 @@
+"""Tests for the XRPL service: NFT metadata encoding, duplicate index, NFT ID extraction."""
+
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from eula.infrastructure.duplicate_index import DuplicateIndex
+from eula.services.xrpl import NFTMetadata, XRPLService
+
+
+def _reference_json(metadata: NFTMetadata) -> str:
+    """EULA_v1 metadata as originally serialized with json.dumps."""
+    return json.dumps({
+        "schema": "EULA_v1",
+        "name": f"Verified Invoice: #{metadata.invoice_number}",
+        "description": "3-Way Matched Supply Chain Asset",
+        "properties": {
+            "issuer_did": metadata.issuer_did,
+            "face_value": str(metadata.face_value),
+            "currency": metadata.currency,
+            "due_date": metadata.due_date.isoformat(),
+            "audit_status": "PASSED_AI_VERIFICATION",
+            "document_hashes": {
+                "invoice_hash": metadata.invoice_hash,
+                "po_hash": metadata.po_hash,
+                "pod_hash": metadata.pod_hash,
+            },
+        },
+    })
+
+
+@pytest.mark.parametrize("text", [
+    "INV-2024-001",
+    "",
+    'quote " and backslash \\',
+    "tab\tnewline\nreturn\r",
+    "control \x00\x01\x1f\x7f",
+    "naïve café – €100",
+    "emoji 🧾 and CJK 発票",
+    "lone surrogate \ud800",
+    "{braces} and {{doubled}}",
+    "</script>&<>'",
+])
+def test_metadata_json_matches_json_dumps(text):
+    metadata = NFTMetadata(
+        invoice_number=text,
+        face_value=Decimal("8000.00"),
+        currency=text,
+        due_date=date(2024, 2, 5),
+        issuer_did=f"did:xrpl:{text}",
+        invoice_hash=text,
+        po_hash="sha256:" + text,
+        pod_hash=text[::-1],
+    )
+
+    assert metadata.to_json() == _reference_json(metadata)
+    assert metadata.hex_uri == metadata.to_json().encode("utf-8").hex().upper()
+    assert metadata.to_hex() == metadata.hex_uri
+
+
+def test_metadata_from_minor_units():
+    metadata = NFTMetadata.from_minor_units(
+        800000,
+        invoice_number="INV-1",
+        currency="RLUSD",
+        due_date=date(2024, 2, 5),
+        issuer_did="did:xrpl:rIssuer",
+        invoice_hash="a",
+        po_hash="b",
+        pod_hash="c",
+    )
+
+    assert metadata.face_value == Decimal("8000.00")
+    assert '"face_value": "8000.00"' in metadata.to_json()
+
+
+def test_duplicate_index_round_trip(tmp_path):
+    path = tmp_path / "nft_hashes.db"
+
+    with DuplicateIndex(path) as index:
+        index.add("sha256:aaa", "NFT_A", "did:xrpl:rA")
+        assert index.lookup("sha256:aaa") == ("NFT_A", "did:xrpl:rA")
+        assert index.lookup("sha256:zzz") is None
+
+    with DuplicateIndex(path) as index:
+        assert index.lookup("sha256:aaa") == ("NFT_A", "did:xrpl:rA")
+        assert index.lookup("sha256:zzz") is None
+        # The first NFT recorded for a hash is kept
+        index.add("sha256:aaa", "NFT_OTHER", "did:xrpl:rB")
+        assert index.lookup("sha256:aaa") == ("NFT_A", "did:xrpl:rA")
+
+
+def test_duplicate_index_replays_rows_added_after_save(tmp_path):
+    path = tmp_path / "nft_hashes.db"
+
+    index = DuplicateIndex(path)
+    index.add("sha256:aaa", "NFT_A", "did:xrpl:rA")
+    index.save()
+    index.add("sha256:bbb", "NFT_B", "did:xrpl:rB")
+    # Simulate a crash: the connection goes away without a final save
+    index._conn.close()
+
+    with DuplicateIndex(path) as index:
+        assert index.lookup("sha256:aaa") == ("NFT_A", "did:xrpl:rA")
+        assert index.lookup("sha256:bbb") == ("NFT_B", "did:xrpl:rB")
+        assert "sha256:bbb" in index._bloom
+
+
+def test_duplicate_index_saves_only_rows_it_has_read(tmp_path):
+    path = tmp_path / "nft_hashes.db"
+
+    first = DuplicateIndex(path)
+    second = DuplicateIndex(path)
+    second.add("sha256:bbb", "NFT_B", "did:xrpl:rB")
+    first.close()
+    # The second worker goes away without saving
+    second._conn.close()
+
+    with DuplicateIndex(path) as index:
+        assert index.lookup("sha256:bbb") == ("NFT_B", "did:xrpl:rB")
+
+
+def test_duplicate_index_sees_hashes_added_by_another_worker(tmp_path):
+    path = tmp_path / "nft_hashes.db"
+
+    with DuplicateIndex(path) as first, DuplicateIndex(path) as second:
+        assert first.lookup("sha256:bbb") is None
+        second.add("sha256:bbb", "NFT_B", "did:xrpl:rB")
+        assert first.lookup("sha256:bbb") == ("NFT_B", "did:xrpl:rB")
+
+
+def test_duplicate_index_rebuilds_filter_of_another_size(tmp_path):
+    path = tmp_path / "nft_hashes.db"
+
+    with DuplicateIndex(path, expected_items=10) as index:
+        index.add("sha256:aaa", "NFT_A", "did:xrpl:rA")
+
+    with DuplicateIndex(path, expected_items=1000) as index:
+        assert index.lookup("sha256:aaa") == ("NFT_A", "did:xrpl:rA")
+
+
+def test_check_duplicate_uses_index():
+    with DuplicateIndex() as index:
+        service = XRPLService(duplicate_index=index)
+        index.add("sha256:aaa", "NFT_A", "did:xrpl:rA")
+
+        found = service.check_duplicate("sha256:aaa")
+        assert found.is_duplicate
+        assert found.existing_nft_id == "NFT_A"
+        assert found.existing_issuer == "did:xrpl:rA"
+        assert not service.check_duplicate("sha256:zzz").is_duplicate
+
+
+def _tokens(*ids: str) -> list[dict]:
+    return [{"NFToken": {"NFTokenID": nft_id, "URI": "AB"}} for nft_id in ids]
+
+
+def test_extract_nft_id_prefers_reported_id():
+    meta = {"nftoken_id": "NFT_NEW", "AffectedNodes": []}
+
+    assert XRPLService()._extract_nft_id({"meta": meta}) == "NFT_NEW"
+
+
+def test_extract_nft_id_from_created_page():
+    meta = {"AffectedNodes": [
+        {"ModifiedNode": {"LedgerEntryType": "AccountRoot", "FinalFields": {}}},
+        {"CreatedNode": {
+            "LedgerEntryType": "NFTokenPage",
+            "NewFields": {"NFTokens": _tokens("NFT_NEW")},
+        }},
+    ]}
+
+    assert XRPLService()._extract_nft_id({"meta": meta}) == "NFT_NEW"
+
+
+def test_extract_nft_id_from_modified_page():
+    meta = {"AffectedNodes": [
+        {"ModifiedNode": {
+            "LedgerEntryType": "NFTokenPage",
+            "PreviousFields": {"NFTokens": _tokens("NFT_1", "NFT_3")},
+            "FinalFields": {"NFTokens": _tokens("NFT_1", "NFT_2", "NFT_3")},
+        }},
+        # A page touched only for its links holds no new token
+        {"ModifiedNode": {
+            "LedgerEntryType": "NFTokenPage",
+            "PreviousFields": {"PreviousPageMin": "00"},
+            "FinalFields": {"NFTokens": _tokens("NFT_9")},
+        }},
+    ]}
+
+    assert XRPLService()._extract_nft_id({"meta": meta}) == "NFT_2"
+
+
+def test_extract_nft_id_from_split_page():
+    # A full page splits: some of its tokens move to a new page, and the new
+    # token may land in either half
+    meta = {"AffectedNodes": [
+        {"CreatedNode": {
+            "LedgerEntryType": "NFTokenPage",
+            "NewFields": {"NFTokens": _tokens("NFT_1", "NFT_2")},
+        }},
+        {"ModifiedNode": {
+            "LedgerEntryType": "NFTokenPage",
+            "PreviousFields": {"NFTokens": _tokens("NFT_1", "NFT_2", "NFT_4", "NFT_5")},
+            "FinalFields": {"NFTokens": _tokens("NFT_3", "NFT_4", "NFT_5")},
+        }},
+    ]}
+
+    assert XRPLService()._extract_nft_id({"meta": meta}) == "NFT_3"
+
+
+def test_extract_nft_id_without_token_pages():
+    assert XRPLService()._extract_nft_id({"meta": {"AffectedNodes": []}}) is None
+    assert XRPLService()._extract_nft_id({}) is None
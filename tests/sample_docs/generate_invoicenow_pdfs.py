@@ -7,41 +7,53 @@ Run: python generate_invoicenow_pdfs.py
 Requires: pip install reportlab
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import date
 
+try:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.units import mm
+    from reportlab.lib.colors import HexColor
+    
+    # Colors (parsed once, shared by every document)
+    HEADER_BLUE = HexColor("#000080")
+    BORDER_BLUE = HexColor("#4169E1")
+    BLACK = HexColor("#000000")
+except ImportError:
+    canvas = None
+
+
+def _draw_page_chrome(c, width: float, height: float, title: str) -> None:
+    """Draw the border and title shared by every InvoiceNow document."""
+    # Border
+    c.setStrokeColor(BORDER_BLUE)
+    c.setLineWidth(2)
+    c.rect(10*mm, 10*mm, width - 20*mm, height - 20*mm)
+    
+    # Header
+    c.setFont("Helvetica-Bold", 24)
+    c.setFillColor(HEADER_BLUE)
+    c.drawRightString(width - 20*mm, height - 25*mm, title)
+    
+    c.setFillColor(BLACK)
+
+
 
 def create_invoicenow_invoice(filename: str, data: dict) -> None:
     """Create an InvoiceNow-style Tax Invoice PDF."""
-    try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.units import mm
-        from reportlab.lib.colors import HexColor
-    except ImportError:
+    if canvas is None:
         print("Install reportlab: pip install reportlab")
         return
     
     c = canvas.Canvas(filename, pagesize=A4)
     width, height = A4
     
-    # Colors
-    header_blue = HexColor("#000080")
-    border_blue = HexColor("#4169E1")
-    
-    # Border
-    c.setStrokeColor(border_blue)
-    c.setLineWidth(2)
-    c.rect(10*mm, 10*mm, width - 20*mm, height - 20*mm)
-    
-    # Header - "Tax Invoice"
-    c.setFont("Helvetica-Bold", 24)
-    c.setFillColor(header_blue)
-    c.drawRightString(width - 20*mm, height - 25*mm, "Tax Invoice")
+    _draw_page_chrome(c, width, height, "Tax Invoice")
     
     # GST Reg No
     c.setFont("Helvetica", 10)
-    c.setFillColor(HexColor("#000000"))
     c.drawRightString(width - 20*mm, height - 35*mm, f"GST Reg No: {data.get('gst_reg', '')}")
     
     # Bill To section
@@ -70,7 +82,7 @@ def create_invoicenow_invoice(filename: str, data: dict) -> None:
     box_width = 60*mm
     box_height = 25*mm
     
-    c.setStrokeColor(HexColor("#000000"))
+    c.setStrokeColor(BLACK)
     c.setLineWidth(0.5)
     c.rect(box_x, box_y, box_width, box_height)
     
@@ -114,15 +126,22 @@ def create_invoicenow_invoice(filename: str, data: dict) -> None:
     c.rect(20*mm, y - 8*mm, width - 40*mm, 10*mm)
     c.setFont("Helvetica-Bold", 9)
     c.drawString(22*mm, y - 5*mm, "Description")
-    c.drawRightString(width - 22*mm, y - 5*mm, f"Amount ({data.get('currency', 'S$')})")
+    currency = data.get("currency", "S$")
+    c.drawRightString(width - 22*mm, y - 5*mm, f"Amount ({currency})")
     
     # Line items
     y -= 18*mm
     c.setFont("Helvetica", 9)
+    draw_string = c.drawString
+    draw_right_string = c.drawRightString
+    set_font = c.setFont
+    desc_x = 22*mm
+    amount_x = width - 22*mm
+    row_height = 6*mm
     for item in data["items"]:
-        c.drawString(22*mm, y, item["description"])
-        c.drawRightString(width - 22*mm, y, f"{data.get('currency', 'S$')}{item['amount']:,.2f}")
-        y -= 6*mm
+        draw_string(desc_x, y, item["description"])
+        draw_right_string(amount_x, y, f"{currency}{item['amount']:,.2f}")
+        y -= row_height
     
     # Totals section (bottom right)
     y = 65*mm
@@ -139,12 +158,13 @@ def create_invoicenow_invoice(filename: str, data: dict) -> None:
         ("Balance Due", data.get("balance_due", data["total"])),
     ]
     
+    label_x = 135*mm
     for label, amount in totals:
-        c.setFont("Helvetica-Bold", 9)
-        c.drawRightString(135*mm, y, f"{label}")
-        c.setFont("Helvetica", 9)
-        c.drawRightString(width - 22*mm, y, f"{data.get('currency', 'S$')}{amount:,.2f}")
-        y -= 6*mm
+        set_font("Helvetica-Bold", 9)
+        draw_right_string(label_x, y, f"{label}")
+        set_font("Helvetica", 9)
+        draw_right_string(amount_x, y, f"{currency}{amount:,.2f}")
+        y -= row_height
     
     # Company name at bottom
     y = 30*mm
@@ -170,29 +190,14 @@ def create_invoicenow_invoice(filename: str, data: dict) -> None:
 
 def create_invoicenow_po(filename: str, data: dict) -> None:
     """Create a Purchase Order matching InvoiceNow style."""
-    try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.units import mm
-        from reportlab.lib.colors import HexColor
-    except ImportError:
+    if canvas is None:
         print("Install reportlab: pip install reportlab")
         return
     
     c = canvas.Canvas(filename, pagesize=A4)
     width, height = A4
     
-    # Border
-    c.setStrokeColor(HexColor("#4169E1"))
-    c.setLineWidth(2)
-    c.rect(10*mm, 10*mm, width - 20*mm, height - 20*mm)
-    
-    # Header
-    c.setFont("Helvetica-Bold", 24)
-    c.setFillColor(HexColor("#000080"))
-    c.drawRightString(width - 20*mm, height - 25*mm, "Purchase Order")
-    
-    c.setFillColor(HexColor("#000000"))
+    _draw_page_chrome(c, width, height, "Purchase Order")
     
     # Buyer info (left)
     y = height - 40*mm
@@ -218,7 +223,7 @@ def create_invoicenow_po(filename: str, data: dict) -> None:
     box_x = 120*mm
     box_y = height - 65*mm
     
-    c.setStrokeColor(HexColor("#000000"))
+    c.setStrokeColor(BLACK)
     c.setLineWidth(0.5)
     c.rect(box_x, box_y, 60*mm, 25*mm)
     
@@ -239,25 +244,30 @@ def create_invoicenow_po(filename: str, data: dict) -> None:
     c.setFont("Helvetica-Bold", 9)
     c.drawString(22*mm, y - 5*mm, "Description")
     c.drawString(100*mm, y - 5*mm, "Qty")
-    c.drawRightString(width - 22*mm, y - 5*mm, f"Amount ({data.get('currency', 'S$')})")
+    currency = data.get("currency", "S$")
+    c.drawRightString(width - 22*mm, y - 5*mm, f"Amount ({currency})")
     
     # Items
     y -= 18*mm
     c.setFont("Helvetica", 9)
-    total_qty = 0
+    draw_string = c.drawString
+    draw_right_string = c.drawRightString
+    desc_x = 22*mm
+    qty_x = 100*mm
+    amount_x = width - 22*mm
+    row_height = 6*mm
     for item in data["items"]:
-        c.drawString(22*mm, y, item["description"])
-        c.drawString(100*mm, y, str(item.get("qty", 1)))
-        c.drawRightString(width - 22*mm, y, f"{data.get('currency', 'S$')}{item['amount']:,.2f}")
-        total_qty += item.get("qty", 1)
-        y -= 6*mm
+        draw_string(desc_x, y, item["description"])
+        draw_string(qty_x, y, str(item.get("qty", 1)))
+        draw_right_string(amount_x, y, f"{currency}{item['amount']:,.2f}")
+        y -= row_height
     
     # Total
     y -= 10*mm
     c.line(120*mm, y + 6*mm, width - 20*mm, y + 6*mm)
     c.setFont("Helvetica-Bold", 10)
     c.drawString(120*mm, y, "Total Authorized Amount:")
-    c.drawRightString(width - 22*mm, y, f"{data.get('currency', 'S$')}{data['total']:,.2f}")
+    c.drawRightString(width - 22*mm, y, f"{currency}{data['total']:,.2f}")
     
     # Authorization
     y -= 20*mm
@@ -278,29 +288,14 @@ def create_invoicenow_po(filename: str, data: dict) -> None:
 
 def create_invoicenow_pod(filename: str, data: dict) -> None:
     """Create a Proof of Delivery matching InvoiceNow style."""
-    try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.units import mm
-        from reportlab.lib.colors import HexColor
-    except ImportError:
+    if canvas is None:
         print("Install reportlab: pip install reportlab")
         return
     
     c = canvas.Canvas(filename, pagesize=A4)
     width, height = A4
     
-    # Border
-    c.setStrokeColor(HexColor("#4169E1"))
-    c.setLineWidth(2)
-    c.rect(10*mm, 10*mm, width - 20*mm, height - 20*mm)
-    
-    # Header
-    c.setFont("Helvetica-Bold", 24)
-    c.setFillColor(HexColor("#000080"))
-    c.drawRightString(width - 20*mm, height - 25*mm, "Delivery Order")
-    
-    c.setFillColor(HexColor("#000000"))
+    _draw_page_chrome(c, width, height, "Delivery Order")
     
     # Shipper info
     y = height - 40*mm
@@ -326,7 +321,7 @@ def create_invoicenow_pod(filename: str, data: dict) -> None:
     box_x = 120*mm
     box_y = height - 65*mm
     
-    c.setStrokeColor(HexColor("#000000"))
+    c.setStrokeColor(BLACK)
     c.setLineWidth(0.5)
     c.rect(box_x, box_y, 60*mm, 25*mm)
     
@@ -352,13 +347,18 @@ def create_invoicenow_pod(filename: str, data: dict) -> None:
     # Items
     y -= 18*mm
     c.setFont("Helvetica", 9)
-    total_qty = 0
-    for item in data["items"]:
-        c.drawString(22*mm, y, item["description"])
-        c.drawString(100*mm, y, str(item.get("qty", 1)))
-        c.drawString(130*mm, y, item.get("status", "Delivered"))
-        total_qty += item.get("qty", 1)
-        y -= 6*mm
+    quantities = [item.get("qty", 1) for item in data["items"]]
+    draw_string = c.drawString
+    desc_x = 22*mm
+    qty_x = 100*mm
+    status_x = 130*mm
+    row_height = 6*mm
+    for item, qty in zip(data["items"], quantities):
+        draw_string(desc_x, y, item["description"])
+        draw_string(qty_x, y, str(qty))
+        draw_string(status_x, y, item.get("status", "Delivered"))
+        y -= row_height
+    total_qty = sum(quantities)
     
     # Total quantity
     y -= 10*mm
@@ -388,8 +388,22 @@ def create_invoicenow_pod(filename: str, data: dict) -> None:
     print(f"Created: {filename}")
 
 
-def generate_invoicenow_valid_set():
-    """Generate a matching InvoiceNow-style document set."""
+# Document kind -> renderer, so render tasks are plain picklable tuples
+RENDERERS = {
+    "invoice": create_invoicenow_invoice,
+    "po": create_invoicenow_po,
+    "pod": create_invoicenow_pod,
+}
+
+
+def _render_one(task: tuple[str, str, dict]) -> None:
+    """Render one (kind, filename, data) task."""
+    kind, filename, data = task
+    RENDERERS[kind](filename, data)
+
+
+def invoicenow_valid_tasks() -> list[tuple[str, str, dict]]:
+    """Render tasks for a matching InvoiceNow-style document set."""
     
     # Based on the uploaded InvoiceNow Tax Invoice
     invoice_data = {
@@ -426,8 +440,6 @@ def generate_invoicenow_valid_set():
         "balance_due": 1000.00,
     }
     
-    create_invoicenow_invoice("invoicenow_valid.pdf", invoice_data)
-    
     # Matching Purchase Order
     po_data = {
         "po_number": "PO-SG-2023-001",
@@ -451,8 +463,6 @@ def generate_invoicenow_valid_set():
         "title": "Procurement Manager",
     }
     
-    create_invoicenow_po("po_invoicenow_valid.pdf", po_data)
-    
     # Matching Proof of Delivery
     pod_data = {
         "delivery_ref": "DEL-SG-2023-001",
@@ -476,11 +486,21 @@ def generate_invoicenow_valid_set():
         "received_by": "Mrs Beth",
     }
     
-    create_invoicenow_pod("pod_invoicenow_valid.pdf", pod_data)
+    return [
+        ("invoice", "invoicenow_valid.pdf", invoice_data),
+        ("po", "po_invoicenow_valid.pdf", po_data),
+        ("pod", "pod_invoicenow_valid.pdf", pod_data),
+    ]
 
 
-def generate_invoicenow_mismatch_set():
-    """Generate InvoiceNow-style documents with mismatches for testing failures."""
+def generate_invoicenow_valid_set():
+    """Generate a matching InvoiceNow-style document set."""
+    for task in invoicenow_valid_tasks():
+        _render_one(task)
+
+
+def invoicenow_mismatch_tasks() -> list[tuple[str, str, dict]]:
+    """Render tasks for InvoiceNow-style documents with mismatches."""
     
     # Invoice with DIFFERENT amount than PO
     invoice_data = {
@@ -517,8 +537,6 @@ def generate_invoicenow_mismatch_set():
         "balance_due": 1500.00,
     }
     
-    create_invoicenow_invoice("invoicenow_invalid.pdf", invoice_data)
-    
     # PO with DIFFERENT amount
     po_data = {
         "po_number": "PO-SG-2023-002",
@@ -542,8 +560,6 @@ def generate_invoicenow_mismatch_set():
         "title": "Procurement Manager",
     }
     
-    create_invoicenow_po("po_invoicenow_invalid.pdf", po_data)
-    
     # POD with DIFFERENT quantity
     pod_data = {
         "delivery_ref": "DEL-SG-2023-002",
@@ -567,7 +583,17 @@ def generate_invoicenow_mismatch_set():
         "received_by": "Mrs Beth",
     }
     
-    create_invoicenow_pod("pod_invoicenow_invalid.pdf", pod_data)
+    return [
+        ("invoice", "invoicenow_invalid.pdf", invoice_data),
+        ("po", "po_invoicenow_invalid.pdf", po_data),
+        ("pod", "pod_invoicenow_invalid.pdf", pod_data),
+    ]
+
+
+def generate_invoicenow_mismatch_set():
+    """Generate InvoiceNow-style documents with mismatches for testing failures."""
+    for task in invoicenow_mismatch_tasks():
+        _render_one(task)
 
 
 if __name__ == "__main__":
@@ -575,11 +601,11 @@ if __name__ == "__main__":
     import os
     os.chdir(output_dir)
     
-    print("Generating InvoiceNow VALID document set...")
-    generate_invoicenow_valid_set()
-    
-    print("\nGenerating InvoiceNow INVALID document set (with mismatches)...")
-    generate_invoicenow_mismatch_set()
+    # Every document is independent, so render them across processes
+    print("Generating InvoiceNow VALID and INVALID document sets...")
+    tasks = invoicenow_valid_tasks() + invoicenow_mismatch_tasks()
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_render_one, tasks))
     
     print("\n=== Generated Files ===")
     print("VALID set (should pass 3-way match):")
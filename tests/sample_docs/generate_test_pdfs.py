@@ -5,9 +5,167 @@ Run: python generate_test_pdfs.py
 Requires: pip install reportlab
 """
 
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def create_pdf(filename: str, lines: list[str]) -> None:
+# Document contents, one entry per line ("# " heading, "## " subheading,
+# "---" rule, anything else body text)
+INVOICE_VALID_LINES = (
+    "# INVOICE",
+    "",
+    "Invoice Number: INV-2024-001",
+    "Invoice Date: January 5, 2024",
+    "Due Date: February 5, 2024",
+    "",
+    "---",
+    "",
+    "## From (Seller):",
+    "Acme Supplies Ltd",
+    "123 Industrial Way",
+    "Business City, BC 12345",
+    "",
+    "## To (Buyer):",
+    "TechCorp Industries",
+    "456 Technology Park",
+    "Tech Valley, TV 67890",
+    "",
+    "---",
+    "",
+    "## Line Items:",
+    "",
+    "Description              Qty    Unit Price    Amount",
+    "---",
+    "Widget Pro X100          50     $100.00       $5,000.00",
+    "Connector Cable 2m       100    $15.00        $1,500.00",
+    "Mounting Kit Standard    50     $30.00        $1,500.00",
+    "",
+    "---",
+    "",
+    "Subtotal: $8,000.00",
+    "Tax (0%): $0.00",
+    "TOTAL DUE: $8,000.00",
+    "",
+    "Reference PO: PO-2024-001",
+)
+
+
+PO_VALID_LINES = (
+    "# PURCHASE ORDER",
+    "",
+    "PO Number: PO-2024-001",
+    "Date: January 2, 2024",
+    "",
+    "---",
+    "",
+    "## Buyer:",
+    "TechCorp Industries",
+    "456 Technology Park",
+    "Tech Valley, TV 67890",
+    "",
+    "## Vendor:",
+    "Acme Supplies Ltd",
+    "123 Industrial Way",
+    "Business City, BC 12345",
+    "",
+    "---",
+    "",
+    "## Order Details:",
+    "",
+    "Description              Qty    Unit Price    Amount",
+    "---",
+    "Widget Pro X100          50     $100.00       $5,000.00",
+    "Connector Cable 2m       100    $15.00        $1,500.00",
+    "Mounting Kit Standard    50     $30.00        $1,500.00",
+    "",
+    "---",
+    "",
+    "Total Authorized Amount: $8,000.00",
+    "",
+    "Authorized By: John Smith",
+    "Title: Procurement Manager",
+)
+
+
+POD_VALID_LINES = (
+    "# PROOF OF DELIVERY",
+    "",
+    "Delivery Reference: DEL-2024-001",
+    "Delivery Date: January 4, 2024",
+    "",
+    "---",
+    "",
+    "## Shipper:",
+    "Acme Supplies Ltd",
+    "",
+    "## Recipient:",
+    "TechCorp Industries",
+    "456 Technology Park",
+    "",
+    "---",
+    "",
+    "## Items Delivered:",
+    "",
+    "Description              Quantity    Status",
+    "---",
+    "Widget Pro X100          50          Received",
+    "Connector Cable 2m       100         Received", 
+    "Mounting Kit Standard    50          Received",
+    "",
+    "Total Quantity: 200 units",
+    "",
+    "---",
+    "",
+    "Condition: Good - No damage",
+    "",
+    "Received By: Jane Doe",
+    "Signature: [SIGNED]",
+    "Date: January 4, 2024",
+)
+
+
+INVOICE_QTY_MISMATCH_LINES = (
+    "# INVOICE",
+    "",
+    "Invoice Number: INV-2024-002",
+    "Invoice Date: January 5, 2024",
+    "Due Date: February 5, 2024",
+    "",
+    "## From: Acme Supplies Ltd",
+    "## To: TechCorp Industries",
+    "",
+    "---",
+    "",
+    "Description              Qty    Amount",
+    "---",
+    "Widget Pro X100          60     $6,000.00",  # Mismatch: 60 vs 50 in PO
+    "",
+    "TOTAL: $6,000.00",
+    "",
+    "Reference PO: PO-2024-001",
+)
+
+# Line kind -> (font or None for a horizontal rule, vertical advance in points)
+LINE_STYLES = {
+    "h1": (("Helvetica-Bold", 16), 24),
+    "h2": (("Helvetica-Bold", 12), 18),
+    "hr": (None, 12),
+    "body": (("Helvetica", 10), 14),
+}
+
+
+def _classify(line: str) -> tuple[str, str]:
+    """Split a content line into its LINE_STYLES kind and the text to draw."""
+    if line.startswith("# "):
+        return "h1", line[2:]
+    if line.startswith("## "):
+        return "h2", line[3:]
+    if line == "---":
+        return "hr", ""
+    return "body", line
+
+
+def create_pdf(filename: str, lines: Sequence[str]) -> None:
     """Create a simple PDF with text lines."""
     try:
         from reportlab.lib.pagesizes import letter
@@ -21,171 +179,55 @@ def create_pdf(filename: str, lines: list[str]) -> None:
     width, height = letter
     
     y = height - inch
-    for line in lines:
-        if line.startswith("# "):
-            c.setFont("Helvetica-Bold", 16)
-            c.drawString(inch, y, line[2:])
-            y -= 24
-        elif line.startswith("## "):
-            c.setFont("Helvetica-Bold", 12)
-            c.drawString(inch, y, line[3:])
-            y -= 18
-        elif line == "---":
+    # Font last set on this page; setFont is skipped while it is unchanged
+    current_font = None
+    
+    for kind, text in map(_classify, lines):
+        font, advance = LINE_STYLES[kind]
+        if font is None:
             c.line(inch, y, width - inch, y)
-            y -= 12
         else:
-            c.setFont("Helvetica", 10)
-            c.drawString(inch, y, line)
-            y -= 14
+            if font != current_font:
+                c.setFont(*font)
+                current_font = font
+            c.drawString(inch, y, text)
+        y -= advance
         
         if y < inch:
             c.showPage()
+            # A new page starts from the default graphics state
+            current_font = None
             y = height - inch
     
     c.save()
     print(f"Created: {filename}")
 
 
+def generate_invoice_valid():
+    """Generate the invoice of the matching set."""
+    create_pdf("invoice_valid.pdf", INVOICE_VALID_LINES)
+
+
+def generate_po_valid():
+    """Generate the purchase order of the matching set."""
+    create_pdf("po_valid.pdf", PO_VALID_LINES)
+
+
+def generate_pod_valid():
+    """Generate the proof of delivery of the matching set."""
+    create_pdf("pod_valid.pdf", POD_VALID_LINES)
+
+
 def generate_valid_set():
     """Generate a matching set of Invoice, PO, and POD."""
-    
-    # Invoice
-    create_pdf("invoice_valid.pdf", [
-        "# INVOICE",
-        "",
-        "Invoice Number: INV-2024-001",
-        "Invoice Date: January 5, 2024",
-        "Due Date: February 5, 2024",
-        "",
-        "---",
-        "",
-        "## From (Seller):",
-        "Acme Supplies Ltd",
-        "123 Industrial Way",
-        "Business City, BC 12345",
-        "",
-        "## To (Buyer):",
-        "TechCorp Industries",
-        "456 Technology Park",
-        "Tech Valley, TV 67890",
-        "",
-        "---",
-        "",
-        "## Line Items:",
-        "",
-        "Description              Qty    Unit Price    Amount",
-        "---",
-        "Widget Pro X100          50     $100.00       $5,000.00",
-        "Connector Cable 2m       100    $15.00        $1,500.00",
-        "Mounting Kit Standard    50     $30.00        $1,500.00",
-        "",
-        "---",
-        "",
-        "Subtotal: $8,000.00",
-        "Tax (0%): $0.00",
-        "TOTAL DUE: $8,000.00",
-        "",
-        "Reference PO: PO-2024-001",
-    ])
-    
-    # Purchase Order
-    create_pdf("po_valid.pdf", [
-        "# PURCHASE ORDER",
-        "",
-        "PO Number: PO-2024-001",
-        "Date: January 2, 2024",
-        "",
-        "---",
-        "",
-        "## Buyer:",
-        "TechCorp Industries",
-        "456 Technology Park",
-        "Tech Valley, TV 67890",
-        "",
-        "## Vendor:",
-        "Acme Supplies Ltd",
-        "123 Industrial Way",
-        "Business City, BC 12345",
-        "",
-        "---",
-        "",
-        "## Order Details:",
-        "",
-        "Description              Qty    Unit Price    Amount",
-        "---",
-        "Widget Pro X100          50     $100.00       $5,000.00",
-        "Connector Cable 2m       100    $15.00        $1,500.00",
-        "Mounting Kit Standard    50     $30.00        $1,500.00",
-        "",
-        "---",
-        "",
-        "Total Authorized Amount: $8,000.00",
-        "",
-        "Authorized By: John Smith",
-        "Title: Procurement Manager",
-    ])
-    
-    # Proof of Delivery
-    create_pdf("pod_valid.pdf", [
-        "# PROOF OF DELIVERY",
-        "",
-        "Delivery Reference: DEL-2024-001",
-        "Delivery Date: January 4, 2024",
-        "",
-        "---",
-        "",
-        "## Shipper:",
-        "Acme Supplies Ltd",
-        "",
-        "## Recipient:",
-        "TechCorp Industries",
-        "456 Technology Park",
-        "",
-        "---",
-        "",
-        "## Items Delivered:",
-        "",
-        "Description              Quantity    Status",
-        "---",
-        "Widget Pro X100          50          Received",
-        "Connector Cable 2m       100         Received", 
-        "Mounting Kit Standard    50          Received",
-        "",
-        "Total Quantity: 200 units",
-        "",
-        "---",
-        "",
-        "Condition: Good - No damage",
-        "",
-        "Received By: Jane Doe",
-        "Signature: [SIGNED]",
-        "Date: January 4, 2024",
-    ])
+    generate_invoice_valid()
+    generate_po_valid()
+    generate_pod_valid()
 
 
 def generate_mismatch_set():
     """Generate a set with quantity mismatch for testing failures."""
-    
-    create_pdf("invoice_qty_mismatch.pdf", [
-        "# INVOICE",
-        "",
-        "Invoice Number: INV-2024-002",
-        "Invoice Date: January 5, 2024",
-        "Due Date: February 5, 2024",
-        "",
-        "## From: Acme Supplies Ltd",
-        "## To: TechCorp Industries",
-        "",
-        "---",
-        "",
-        "Description              Qty    Amount",
-        "---",
-        "Widget Pro X100          60     $6,000.00",  # Mismatch: 60 vs 50 in PO
-        "",
-        "TOTAL: $6,000.00",
-        "",
-        "Reference PO: PO-2024-001",
-    ])
+    create_pdf("invoice_qty_mismatch.pdf", INVOICE_QTY_MISMATCH_LINES)
 
 
 if __name__ == "__main__":
@@ -194,10 +236,16 @@ if __name__ == "__main__":
     import os
     os.chdir(output_dir)
     
-    print("Generating valid document set...")
-    generate_valid_set()
-    
-    print("\nGenerating mismatch document set...")
-    generate_mismatch_set()
+    # Each document is an independent file, so they are written concurrently
+    print("Generating valid and mismatch document sets...")
+    generators = [
+        generate_invoice_valid,
+        generate_po_valid,
+        generate_pod_valid,
+        generate_mismatch_set,
+    ]
+    with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+        for future in [executor.submit(generate) for generate in generators]:
+            future.result()
     
     print("\nDone! Use these PDFs to test the verification API.")
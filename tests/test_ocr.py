@@ -11,10 +11,20 @@ Or from backend directory:
 """
 
 import argparse
+import contextlib
+import hashlib
+import importlib.metadata
+import io
 import json
 import logging
+import os
 import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 # Add backend/src to path for imports
 project_root = Path(__file__).parent.parent
@@ -22,6 +32,32 @@ backend_src = project_root / "backend" / "src"
 sys.path.insert(0, str(backend_src))
 
 from eula.services.ocr import OCREngine, FieldNormalizer, TableDetector, SmartFieldExtractor
+from eula.services.ocr import engine as ocr_engine
+from eula.services.ocr.engine import OCRResult
+
+# OCR results keyed by file content and engine setup, reused across runs
+OCR_CACHE_DIR = Path.home() / ".cache" / "eula_ocr"
+
+# Bump when the cached result format (OCRResult.to_json) changes
+OCR_CACHE_VERSION = 1
+
+# Fields reported for every file: name -> (extractor field kind, labels)
+TEST_FIELDS = {
+    "invoice_number": ("invoice_number", None),
+    "po_number": ("po_number", None),
+    "total": ("amount", ["total", "amount due", "grand total", "total due"]),
+    "invoice_date": ("date", ["invoice date", "date", "issued"]),
+    "due_date": ("date", ["due date", "payment due", "pay by"]),
+    "quantity": ("quantity", ["quantity", "qty", "total quantity", "units"]),
+    "seller": ("name", ["from", "seller", "vendor", "sold by"]),
+    "buyer": ("name", ["to", "bill to", "buyer", "sold to"]),
+}
+
+# Parallel files by default: every worker holds its own copy of the docTR model
+DEFAULT_WORKERS = 2
+
+# Engines shared by every file processed in this process (see init_engines)
+_engines: tuple[OCREngine, TableDetector, SmartFieldExtractor] | None = None
 
 
 def setup_logging(level: str = "INFO"):
@@ -39,102 +75,275 @@ def setup_logging(level: str = "INFO"):
         logging.getLogger("eula").setLevel(logging.DEBUG)
 
 
+def init_engines(
+    debug: bool = False,
+    log_level: str = "INFO",
+    use_text_layer: bool = False,
+    torch_threads: int | None = None,
+) -> None:
+    """
+    Create this process's OCR engine, table detector and field extractor.
+    
+    Runs once per worker process (as the pool initializer), so the docTR
+    model is loaded once per process rather than once per file. Pool
+    workers pass torch_threads so that together they use each core once,
+    rather than every worker's torch claiming all of them.
+    """
+    global _engines
+    setup_logging(log_level)
+    if torch_threads is not None:
+        import torch
+        
+        torch.set_num_threads(torch_threads)
+    _engines = (
+        OCREngine(debug=debug, use_text_layer=use_text_layer),
+        TableDetector(),
+        SmartFieldExtractor(),
+    )
+
+
+def read_ahead(paths: list[Path]) -> Iterator[bytes | None]:
+    """
+    Yield each file's bytes, reading the next file while the caller works.
+    
+    At most one file is read ahead. None is yielded for a file that could
+    not be read, leaving the caller to report the error.
+    """
+    if not paths:
+        return
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(Path.read_bytes, paths[0])
+        for next_path in [*paths[1:], None]:
+            try:
+                content = pending.result()
+            except OSError:
+                content = None
+            if next_path is not None:
+                pending = executor.submit(Path.read_bytes, next_path)
+            yield content
+
+
+def engine_fingerprint(ocr: OCREngine) -> str:
+    """
+    Describe everything that can change the engine's output for a file.
+    
+    Covers the cache format, the engine options, the docTR version and the
+    engine module's own source, so a changed pipeline never reuses results.
+    """
+    try:
+        doctr_version = importlib.metadata.version("python-doctr")
+    except importlib.metadata.PackageNotFoundError:
+        doctr_version = None
+    archs = ocr_engine.FAST_ARCHS if ocr.fast else ocr_engine.ACCURATE_ARCHS
+    source = Path(ocr_engine.__file__).read_bytes()
+    return json.dumps([
+        OCR_CACHE_VERSION,
+        archs,
+        ocr_engine.PDF_RENDER_SCALE,
+        ocr_engine.TEXT_LAYER_MIN_CHARS if ocr.use_text_layer else None,
+        doctr_version,
+        hashlib.blake2b(source, digest_size=16).hexdigest(),
+    ])
+
+
+def write_cache_entry(cache_path: Path, data: str) -> None:
+    """
+    Write a cache entry atomically.
+    
+    The data goes to a temporary file in the cache directory which then
+    replaces the entry, so a concurrent reader or an interrupted run never
+    sees a partial file.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+            tmp.write(data)
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def run_ocr_cached(
+    ocr: OCREngine,
+    file_path: Path,
+    save_json: bool = False,
+    content: bytes | None = None,
+) -> OCRResult:
+    """
+    Run OCR on a file, reusing the cached result for identical file content.
+    
+    Cache entries are keyed by a hash of the file bytes and the engine
+    fingerprint, so an edited file or a changed engine is always
+    re-processed.
+    """
+    start_time = time.time()
+    if content is None:
+        content = file_path.read_bytes()
+    digest = hashlib.blake2b(content, digest_size=16)
+    digest.update(engine_fingerprint(ocr).encode("utf-8"))
+    key = digest.hexdigest()
+    cache_path = OCR_CACHE_DIR / f"{key}.json"
+    
+    try:
+        result = OCRResult.from_json(cache_path.read_bytes())
+    except FileNotFoundError:
+        result = None
+    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+        # A truncated or stale entry is a miss; it is rewritten below
+        print(f"Ignoring unreadable OCR cache entry: {cache_path}")
+        result = None
+    
+    if result is None:
+        result = ocr.process_file(file_path, save_debug=save_json, content=content)
+        write_cache_entry(cache_path, result.to_json())
+        return result
+    
+    result.processing_time_ms = (time.time() - start_time) * 1000
+    print(f"OCR result loaded from cache: {cache_path}")
+    
+    if save_json or ocr.debug:
+        result.save_debug_output(file_path.with_suffix(".ocr_debug.json"))
+    
+    return result
+
+
 def test_single_file(
     file_path: Path,
-    debug: bool = False,
+    ocr: OCREngine,
+    table_detector: TableDetector,
+    extractor: SmartFieldExtractor,
     save_json: bool = False,
     show_tables: bool = False,
+    use_cache: bool = True,
+    content: bytes | None = None,
 ) -> dict:
-    """Test OCR on a single file."""
-    print(f"\n{'=' * 70}")
-    print(f"Processing: {file_path.name}")
-    print(f"{'=' * 70}")
+    """
+    Test OCR on a single file using already-initialized engines.
     
-    # Initialize engines
-    ocr = OCREngine(debug=debug)
-    table_detector = TableDetector()
-    extractor = SmartFieldExtractor()  # New smart extractor!
+    content may carry the file's bytes when they were read ahead.
+    """
+    print(f"\n{'=' * 70}\nProcessing: {file_path.name}\n{'=' * 70}")
     
     # Run OCR
-    result = ocr.process_file(file_path, save_debug=save_json)
+    if use_cache:
+        result = run_ocr_cached(ocr, file_path, save_json=save_json, content=content)
+    else:
+        result = ocr.process_file(file_path, save_debug=save_json, content=content)
     
     # Print summary
     result.print_summary()
     
+    # The rest of the report is collected and written in one go
+    out: list[str] = []
+    
     # Detect tables
     if show_tables:
-        print("\n" + "-" * 70)
-        print("TABLE DETECTION")
-        print("-" * 70)
+        out.append("\n" + "-" * 70)
+        out.append("TABLE DETECTION")
+        out.append("-" * 70)
         
         tables = table_detector.detect_tables(result)
         
         if tables:
             for i, table in enumerate(tables):
-                print(f"\nTable {i + 1}:")
-                print(f"  Rows: {len(table.rows)}")
-                print(f"  Columns: {len(table.columns)}")
-                print(f"  Headers: {table.header_row}")
+                out.append(f"\nTable {i + 1}:")
+                out.append(f"  Rows: {len(table.rows)}")
+                out.append(f"  Columns: {len(table.columns)}")
+                out.append(f"  Headers: {table.header_row}")
                 
                 # Print first few rows
                 for row_idx, row in enumerate(table.rows[:5]):
-                    cells = [str(c.text)[:15] for c in row.cells]
-                    print(f"  Row {row_idx}: {' | '.join(cells)}")
+                    cells = [str(c.text)[:15] for c in row.cells if c is not None]
+                    out.append(f"  Row {row_idx}: {' | '.join(cells)}")
         else:
-            print("  No tables detected")
+            out.append("  No tables detected")
     
     # === SMART FIELD EXTRACTION using regex + label proximity ===
-    print("\n" + "-" * 70)
-    print("SMART FIELD EXTRACTION (regex + label proximity)")
-    print("-" * 70)
-    
-    # Invoice fields
-    invoice_num = extractor.extract_invoice_number(result)
-    print(f"  Invoice Number: '{invoice_num.value}' (conf: {invoice_num.confidence:.0%})")
-    
-    po_num = extractor.extract_po_number(result)
-    print(f"  PO Number:      '{po_num.value}' (conf: {po_num.confidence:.0%})")
-    
-    total = extractor.extract_amount(result, ["total", "amount due", "grand total", "total due"])
-    print(f"  Total Amount:   ${total.value} (conf: {total.confidence:.0%})")
-    
-    inv_date = extractor.extract_date(result, ["invoice date", "date", "issued"])
-    print(f"  Invoice Date:   {inv_date.value} (conf: {inv_date.confidence:.0%})")
+    out.append("\n" + "-" * 70)
+    out.append("SMART FIELD EXTRACTION (regex + label proximity)")
+    out.append("-" * 70)
     
-    due_date = extractor.extract_date(result, ["due date", "payment due", "pay by"])
-    print(f"  Due Date:       {due_date.value} (conf: {due_date.confidence:.0%})")
+    fields = extractor.extract_all(result, TEST_FIELDS)
+    invoice_num = fields["invoice_number"]
+    po_num = fields["po_number"]
+    total = fields["total"]
+    inv_date = fields["invoice_date"]
+    due_date = fields["due_date"]
+    qty = fields["quantity"]
+    seller = fields["seller"]
+    buyer = fields["buyer"]
     
-    qty = extractor.extract_quantity(result, ["quantity", "qty", "total quantity", "units"])
-    print(f"  Quantity:       {qty.value} (conf: {qty.confidence:.0%})")
+    # Stringified once for both the report and the returned summary
+    total_text = str(total.value)
+    inv_date_text = str(inv_date.value)
+    due_date_text = str(due_date.value)
     
-    seller = extractor.extract_name(result, ["from", "seller", "vendor", "sold by"])
-    print(f"  Seller:         '{seller.value}' (conf: {seller.confidence:.0%})")
-    
-    buyer = extractor.extract_name(result, ["to", "bill to", "buyer", "sold to"])
-    print(f"  Buyer:          '{buyer.value}' (conf: {buyer.confidence:.0%})")
+    out.append(f"  Invoice Number: '{invoice_num.value}' (conf: {invoice_num.confidence:.0%})")
+    out.append(f"  PO Number:      '{po_num.value}' (conf: {po_num.confidence:.0%})")
+    out.append(f"  Total Amount:   ${total_text} (conf: {total.confidence:.0%})")
+    out.append(f"  Invoice Date:   {inv_date_text} (conf: {inv_date.confidence:.0%})")
+    out.append(f"  Due Date:       {due_date_text} (conf: {due_date.confidence:.0%})")
+    out.append(f"  Quantity:       {qty.value} (conf: {qty.confidence:.0%})")
+    out.append(f"  Seller:         '{seller.value}' (conf: {seller.confidence:.0%})")
+    out.append(f"  Buyer:          '{buyer.value}' (conf: {buyer.confidence:.0%})")
     
     # Save JSON output
     if save_json:
-        output_path = file_path.with_suffix(".ocr_output.json")
+        output_path = file_path.parent / f"{file_path.stem}.ocr_output.json"
         result.save_debug_output(output_path)
-        print(f"\nJSON output saved to: {output_path}")
+        out.append(f"\nJSON output saved to: {output_path}")
+    
+    print("\n".join(out))
     
     return {
         "file": str(file_path),
         "pages": len(result.pages),
         "blocks": result.total_blocks,
         "avg_confidence": result.avg_confidence,
-        "low_confidence": len(result.low_confidence_blocks),
+        "low_confidence": result.low_confidence_count,
         "processing_time_ms": result.processing_time_ms,
         "extracted": {
             "invoice_number": invoice_num.value,
-            "total_amount": str(total.value),
-            "invoice_date": str(inv_date.value),
-            "due_date": str(due_date.value),
+            "total_amount": total_text,
+            "invoice_date": inv_date_text,
+            "due_date": due_date_text,
         },
     }
 
 
+def process_file_task(
+    task: tuple[Path, bool, bool, bool, bool, bytes | None],
+) -> tuple[dict | None, str]:
+    """
+    Run test_single_file and capture its console output.
+    
+    Module-level so it can run in worker processes; each file's report is
+    returned as one string so reports from parallel workers never interleave.
+    """
+    file_path, debug, save_json, show_tables, use_cache, content = task
+    output = io.StringIO()
+    result = None
+    
+    with contextlib.redirect_stdout(output):
+        try:
+            result = test_single_file(
+                file_path,
+                *_engines,
+                save_json=save_json,
+                show_tables=show_tables,
+                use_cache=use_cache,
+                content=content,
+            )
+        except Exception as e:
+            print(f"Error processing {file_path}: {e}")
+            if debug:
+                traceback.print_exc(file=output)
+    
+    return result, output.getvalue()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Test EULA OCR pipeline on documents",
@@ -152,6 +361,12 @@ Examples:
   
   # Show table detection
   python tests/test_ocr.py invoice.pdf --tables
+  
+  # Re-run OCR instead of using cached results
+  python tests/test_ocr.py invoice.pdf --no-cache
+  
+  # Read born-digital PDFs from their embedded text, skipping OCR
+  python tests/test_ocr.py invoice.pdf --text-layer
         """,
     )
     
@@ -176,6 +391,22 @@ Examples:
         action="store_true",
         help="Show table detection results",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always run OCR instead of reusing results cached in {OCR_CACHE_DIR}",
+    )
+    parser.add_argument(
+        "--text-layer",
+        action="store_true",
+        help="Skip OCR for PDFs with embedded text and read that text instead",
+    )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Files processed in parallel, each in its own process (default: {DEFAULT_WORKERS})",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -187,41 +418,64 @@ Examples:
     
     setup_logging(args.log_level)
     
-    results = []
-    
+    paths = []
     for file_path in args.files:
         if not file_path.exists():
             print(f"Error: File not found: {file_path}")
             continue
-        
-        try:
-            result = test_single_file(
-                file_path,
-                debug=args.debug,
-                save_json=args.save_json,
-                show_tables=args.tables,
-            )
+        paths.append(file_path)
+    options = (args.debug, args.save_json, args.tables, not args.no_cache)
+    
+    # Each file is independent OCR work, so files run in separate processes;
+    # reports are printed whole, in the order the files were given
+    workers = min(args.workers, len(paths))
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_engines,
+            initargs=(
+                args.debug,
+                args.log_level,
+                args.text_layer,
+                max(1, (os.cpu_count() or 1) // workers),
+            ),
+        ) as executor:
+            tasks = [(path, *options, None) for path in paths]
+            outcomes = list(executor.map(process_file_task, tasks))
+    else:
+        # Sequential run: read the next file from disk while this one is OCR'd
+        init_engines(args.debug, args.log_level, args.text_layer)
+        outcomes = (
+            process_file_task((path, *options, content))
+            for path, content in zip(paths, read_ahead(paths))
+        )
+    
+    results = []
+    for result, output in outcomes:
+        sys.stdout.write(output)
+        if result is not None:
             results.append(result)
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}")
-            if args.debug:
-                import traceback
-                traceback.print_exc()
     
     # Print summary if multiple files
     if len(results) > 1:
-        print("\n" + "=" * 70)
-        print("BATCH SUMMARY")
-        print("=" * 70)
-        
-        total_blocks = sum(r["blocks"] for r in results)
-        avg_conf = sum(r["avg_confidence"] for r in results) / len(results)
-        total_time = sum(r["processing_time_ms"] for r in results)
+        total_blocks = 0
+        confidence_sum = 0.0
+        total_time = 0.0
+        for r in results:
+            total_blocks += r["blocks"]
+            confidence_sum += r["avg_confidence"]
+            total_time += r["processing_time_ms"]
+        avg_conf = confidence_sum / len(results)
         
-        print(f"Files processed: {len(results)}")
-        print(f"Total blocks: {total_blocks}")
-        print(f"Average confidence: {avg_conf:.1%}")
-        print(f"Total processing time: {total_time:.0f}ms")
+        print("\n".join([
+            "\n" + "=" * 70,
+            "BATCH SUMMARY",
+            "=" * 70,
+            f"Files processed: {len(results)}",
+            f"Total blocks: {total_blocks}",
+            f"Average confidence: {avg_conf:.1%}",
+            f"Total processing time: {total_time:.0f}ms",
+        ]))
 
 
 if __name__ == "__main__":